@@ -2,6 +2,7 @@
 Common classes and interfaces used throughout the QNet library.
 """
 
+import sys
 import inspect
 import itertools
 import heapq
@@ -10,13 +11,17 @@ from enum import Enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, fields, _MISSING_TYPE
 from typing import (
-    TypeVar, Generic, Optional, Iterable, Callable,
+    TypeVar, Generic, Optional, Iterable, Callable, NamedTuple,
     Protocol, Union, Any, cast, runtime_checkable
 )
 
 INF_TIME = float("inf")
 TIME_EPS = 1e-6
 
+# Extra dataclass() options for hot, frequently updated records: slots are only supported since Python 3.10.
+# Note that zero-argument super() does not work inside slotted dataclasses, call the base class explicitly.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 I = TypeVar("I", bound="Item")
 M = TypeVar("M", bound="Metrics")
 T = TypeVar("T")
@@ -27,6 +32,7 @@ class SupportsDict(Protocol):
     """
     Protocol specifying that the implementing class can convert itself into a dictionary.
     """
+    __slots__ = ()
 
     def to_dict(self) -> dict[str, Any]:
         ...
@@ -40,12 +46,12 @@ class ActionType(str, Enum):
     OUT = "out"
 
 
-@dataclass(eq=False)
-class ActionRecord(Generic[T]):
+class ActionRecord(NamedTuple):
     """
     Records a single action (IN or OUT) on a node, along with the current simulation time.
+    A named tuple, as one is created for every arrival and departure of a recorded item.
     """
-    node: T
+    node: Any
     action_type: ActionType
     time: float
 
@@ -89,7 +95,7 @@ class Item(SupportsDict):
         return {"id": self.id}
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class Metrics(Protocol):
     """
     A base protocol for any simulation metrics.
@@ -97,6 +103,11 @@ class Metrics(Protocol):
     """
     passed_time: float = field(init=False, default=0)
 
+    def __post_init__(self) -> None:
+        # Slotted metrics have no class-level defaults to fall back on,
+        # so non-constructor fields are always initialized explicitly.
+        self.reset()
+
     def to_dict(self) -> dict[str, Any]:
         metrics_dict = {
             name: getattr(self, name)
@@ -110,8 +121,11 @@ class Metrics(Protocol):
     def reset(self) -> None:
         """
         Resets all fields of a dataclass-based metrics object to default.
+        Constructor arguments (configuration) are kept as is.
         """
         for param in fields(self):
+            if param.init:
+                continue
             if not isinstance(param.default, _MISSING_TYPE):
                 default_val = param.default
             elif not isinstance(param.default_factory, _MISSING_TYPE):
@@ -195,6 +209,16 @@ class Queue(BoundedCollection[T]):
     def data(self) -> Iterable[T]:
         return self.queue
 
+    # is_empty/is_full read the deque directly instead of going through __len__, bounded and maxlen
+    @property
+    def is_empty(self) -> bool:
+        return not self.queue
+
+    @property
+    def is_full(self) -> bool:
+        maxlen = self.queue.maxlen
+        return maxlen is not None and len(self.queue) >= maxlen
+
     def clear(self) -> None:
         self.queue.clear()
 
@@ -244,9 +268,19 @@ class MinHeap(BoundedCollection[T]):
     def data(self) -> Iterable[T]:
         return self.heap
 
+    # is_empty/is_full/min read the list directly instead of going through __len__, bounded and maxlen
+    @property
+    def is_empty(self) -> bool:
+        return not self.heap
+
+    @property
+    def is_full(self) -> bool:
+        return self._maxlen is not None and len(self.heap) >= self._maxlen
+
     @property
     def min(self) -> Optional[T]:
-        return None if self.is_empty else self.heap[0]
+        heap = self.heap
+        return heap[0] if heap else None
 
     def clear(self) -> None:
         self.heap.clear()
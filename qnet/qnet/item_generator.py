@@ -2,25 +2,28 @@
 Factory node: continuously creates items for a queueing network.
 """
 
-import itertools
-from abc import abstractmethod
-from typing import Iterable, Optional, Any
+from abc import ABC, abstractmethod
+from typing import ClassVar, Iterable, Optional, Any
 
 from .core_models import I, Item
 from .simulation_node import NM, Node
 from .helpers import filter_none
 
 
-class BaseFactoryNode(Node[I, NM]):
+class BaseFactoryNode(Node[I, NM], ABC):
     """
     Abstract Node that generates new items at some specified arrival process (delay_fn).
     """
 
+    __slots__ = ("item", "num_created")
+
+    counts_as_event: ClassVar[bool] = True
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.item: Optional[I] = None
         self.next_time = self._predict_next_time()
-        self.counter = itertools.count()
+        self.num_created: int = 0
 
     @property
     def current_items(self) -> Iterable[I]:
@@ -28,7 +31,9 @@ class BaseFactoryNode(Node[I, NM]):
 
     @property
     def next_id(self) -> str:
-        return f"{self.num_nodes}_{next(self.counter)}"
+        item_id = f"{self.node_index}_{self.num_created}"
+        self.num_created += 1
+        return item_id
 
     def start_action(self, item: I) -> None:
         super().start_action(item)
@@ -52,6 +57,16 @@ class BaseFactoryNode(Node[I, NM]):
         })
         return node_dict
 
+    def snapshot(self) -> dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot.update({"item": self.item, "num_created": self.num_created})
+        return snapshot
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        super().restore(snapshot)
+        self.item = snapshot["item"]
+        self.num_created = snapshot["num_created"]
+
     @abstractmethod
     def _get_next_item(self) -> I:
         raise NotImplementedError
@@ -61,6 +76,7 @@ class FactoryNode(BaseFactoryNode[Item, NM]):
     """
     Simple factory node that produces generic Items.
     """
+    __slots__ = ()
 
     def _get_next_item(self) -> Item:
         """
@@ -4,7 +4,7 @@ Transition nodes: route items to another node with zero processing time, optiona
 
 import random
 import itertools
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from typing import Iterable, Optional, Any, cast
 
 from .core_models import INF_TIME, I
@@ -13,10 +13,11 @@ from .helpers import filter_none
 from collections import defaultdict
 
 
-class BaseTransitionNode(Node[I, NM]):
+class BaseTransitionNode(Node[I, NM], ABC):
     """
     A node that immediately transfers an item to another node (no queue, no channels).
     """
+    __slots__ = ("item",)
 
     def __init__(self, delay_fn: DelayFn = lambda: 0, **kwargs: Any) -> None:
         super().__init__(delay_fn=delay_fn, **kwargs)
@@ -51,6 +52,15 @@ class BaseTransitionNode(Node[I, NM]):
             "next_node": self.next_node.name if self.next_node else None
         }
 
+    def snapshot(self) -> dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot["item"] = self.item
+        return snapshot
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        super().restore(snapshot)
+        self.item = snapshot["item"]
+
     def _before_time_update_hook(self, time: float) -> None:
         """
         Ensure that at each time step, we do not have a next_node set in advance.
@@ -73,19 +83,26 @@ class PriorityGroupTransitionNode(BaseTransitionNode[I, NM]):
     Implements Grouped Priority Routing.
     
     Logic:
-    1. Check Priority 1 group. Identify ALL available nodes.
-    2. If candidates exist -> Pick RANDOM one (load balancing).
-    3. If none available -> Check Priority 2 group.
-    4. ...
-    5. If ALL groups are full -> Return a random node from Priority 1 
+    1. Check Priority 1 group, in round-robin order: starting after the node picked last
+       from this group, take the first node that can accept the item (load balancing).
+    2. If none available -> Check Priority 2 group the same way.
+    3. ...
+    4. If ALL groups are full -> Return the next node in turn from Priority 1
        (to trigger blocking/waiting for the best resource).
+
+    The selection is deterministic: free nodes of a group are picked in turn, skipping full ones.
     """
+    __slots__ = ("priority_groups", "_sorted_groups", "_rr_cursors")
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         # Dictionary mapping priority level to a list of nodes.
         # Structure: { 1: [NodeA, NodeB], 2: [NodeC] }
         self.priority_groups: dict[int, list[Node[I, NodeMetrics]]] = defaultdict(list)
+        # (priority, nodes) groups ordered from the highest priority down, rebuilt lazily after add_next_node()
+        self._sorted_groups: Optional[list[tuple[int, list[Node[I, NodeMetrics]]]]] = None
+        # Round-robin position within each priority group: index of the node to try first next time
+        self._rr_cursors: dict[int, int] = {}
 
     @property
     def connected_nodes(self) -> Iterable["Node[I, NodeMetrics]"]:
@@ -106,43 +123,66 @@ class PriorityGroupTransitionNode(BaseTransitionNode[I, NM]):
                       Lower number = Higher priority (e.g., 1 is higher than 2).
         """
         self.priority_groups[priority].append(node)
+        self._sorted_groups = None
+
+    def reset(self) -> None:
+        super().reset()
+        self._rr_cursors.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot["rr_cursors"] = dict(self._rr_cursors)
+        return snapshot
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        super().restore(snapshot)
+        self._rr_cursors = dict(snapshot["rr_cursors"])
 
     def _get_next_node(self, _: I) -> Optional[Node[I, NodeMetrics]]:
         """
         Determines the destination based on availability and priority.
         """
-        if not self.priority_groups:
+        sorted_groups = self._sorted_groups
+        if sorted_groups is None:
+            # Sort once per change of the groups, to process Priority 1, then 2, then 3...
+            sorted_groups = self._sorted_groups = [
+                (prio, nodes) for prio, nodes in sorted(self.priority_groups.items()) if nodes
+            ]
+        if not sorted_groups:
             return None
 
-        # Sort keys to ensure we process Priority 1, then 2, then 3...
-        sorted_priorities = sorted(self.priority_groups.keys())
+        rr_cursors = self._rr_cursors
 
         # --- Step 1: Search for an available node ---
-        for prio in sorted_priorities:
-            nodes_in_group = self.priority_groups[prio]
-            
-            # Find all nodes in this priority group that have capacity
-            available_nodes = [node for node in nodes_in_group if node.can_accept_item()]
-            
-            if available_nodes:
-                # If we found space, pick one randomly to balance the load
-                return random.choice(available_nodes)
+        for prio, nodes_in_group in sorted_groups:
+            # Walk the whole group once, starting at its cursor, and take the first node with capacity
+            num_nodes = len(nodes_in_group)
+            start = rr_cursors.get(prio, 0)
+            for offset in range(num_nodes):
+                idx = (start + offset) % num_nodes
+                node = nodes_in_group[idx]
+                if node.can_accept_item():
+                    # The next search in this group starts after the picked node
+                    rr_cursors[prio] = idx + 1
+                    return node
         
         # --- Step 2: Handle Blocking (All nodes are full) ---
         # If we reached this point, every node in every priority group is busy.
         # According to the blocking logic ("wait for the intended resource"),
         # we should block on the HIGHEST priority group.
-        highest_prio = sorted_priorities[0]
-        
-        # We pick a random node from the highest priority group.
+        # We pick the next node in turn from the highest priority group.
         # The BaseTransitionNode will attempt to push to it, fail (because it's full),
         # and enter the BLOCKED state, waiting for this specific node to free up.
-        return random.choice(self.priority_groups[highest_prio])
+        prio, nodes_in_group = sorted_groups[0]
+        idx = rr_cursors.get(prio, 0) % len(nodes_in_group)
+        rr_cursors[prio] = idx + 1
+        return nodes_in_group[idx]
 
 class ProbaTransitionNode(BaseTransitionNode[I, NM]):
     """
     A node that routes an item to one of multiple next_nodes with given probabilities.
     """
+    __slots__ = ("proba_sum", "next_nodes", "next_probas")
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
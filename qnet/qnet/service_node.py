@@ -3,16 +3,22 @@ QueueingNode: a node with a waiting queue and a pool of service channels (Channe
 """
 
 import itertools
+import logging
+from collections import deque
 from dataclasses import dataclass, field
-from logging import DEBUG
-from typing import Iterator, Iterable, Optional, Generic, ClassVar, TypeVar, Any, Callable
+from typing import Iterator, Iterable, NamedTuple, Optional, Generic, ClassVar, TypeVar, Any, Callable
 
-from .core_models import INF_TIME, TIME_EPS, I, T, SupportsDict, BoundedCollection, MinHeap, ActionRecord, ActionType
+from .core_models import DATACLASS_SLOTS, INF_TIME, TIME_EPS, I, T, SupportsDict, BoundedCollection, MinHeap, ActionRecord, ActionType
 from .simulation_node import Node, NodeMetrics, NodeState
 from .helpers import filter_none
 
 QM = TypeVar("QM", bound="QueueingMetrics")
 
+log = logging.getLogger(__name__)
+
+# Validate the blocking invariants on every end_action() (expensive, for debugging only)
+DEBUG = False
+
 # BlockingPredicate: B(S,t) function that returns True if blocking should occur
 # S = state (can access 'node' and 'next_node' via closure)
 # t = current_time
@@ -62,18 +68,15 @@ class RerouteOnBlockStrategy(BlockingStrategy):
 class BlockStrategy(BlockingStrategy):
     """Default BAS behavior: hold the item and block the channel."""
     def handle_blocked_item(self, node: 'QueueingNode', item: Any) -> bool:
-        # Create a task wrapper for the blocked item
-        task = Task(
-            item=item, 
-            next_time=node.current_time,
-            blocked_start_time=node.current_time
-        )
-        node.blocked_tasks.append(task)
-        node.metrics.num_blocks += 1
+        blocked_tasks = node.blocked_tasks
+        metrics = node.metrics
+        blocked_tasks.append(BlockedTask(item, node.current_time, node.current_time))
+        metrics.num_blocks += 1
         
         # Track max blocked stats
-        if len(node.blocked_tasks) > node.metrics.max_blocked_tasks:
-            node.metrics.max_blocked_tasks = len(node.blocked_tasks)
+        num_blocked = len(blocked_tasks)
+        if num_blocked > metrics.max_blocked_tasks:
+            metrics.max_blocked_tasks = num_blocked
         
         node.state = NodeState.BLOCKED
         if node.next_node:
@@ -101,30 +104,52 @@ class ReprocessStrategy(BlockingStrategy):
             node._item_out_hook(item)
             return True
 
-@dataclass(eq=False)
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class QueueingMetrics(NodeMetrics):
     """
     Standard queueing metrics with proper blocking tracking.
+
+    Arrival/departure intervals are sampled every `sample_stride`-th event, counted down by
+    `in_countdown`/`out_countdown` so that subclasses adjusting num_in/num_out (e.g. when moving
+    items between nodes) do not shift the sampling phase. The default stride of 1 measures every
+    interval and averages over num_in - 1 (num_out - 1) intervals, as without sampling.
     """
+    sample_stride: int = 1
     total_wait_time: float = field(init=False, default=0)
     load_time_per_channel: dict[int, float] = field(init=False, default_factory=dict)
     in_time: float = field(init=False, default=0)
     out_time: float = field(init=False, default=0)
     in_intervals_sum: float = field(init=False, default=0)
     out_intervals_sum: float = field(init=False, default=0)
+    # Events left until the next sampled interval starts (set from sample_stride by reset())
+    in_countdown: int = field(init=False, default=0)
+    out_countdown: int = field(init=False, default=0)
+    num_in_samples: int = field(init=False, default=0)
+    num_out_samples: int = field(init=False, default=0)
     num_failures: int = field(init=False, default=0)
     blocked_time: float = field(init=False, default=0)
     num_blocks: int = field(init=False, default=0)
     num_drops: int = field(init=False, default=0)
     max_blocked_tasks: int = field(init=False, default=0)
 
+    def __post_init__(self) -> None:
+        if self.sample_stride < 1:
+            raise ValueError(f"sample_stride must be a positive integer, got {self.sample_stride!r}")
+        NodeMetrics.__post_init__(self)
+
+    def reset(self) -> None:
+        NodeMetrics.reset(self)
+        self.in_countdown = self.out_countdown = self.sample_stride - 1
+
     @property
     def mean_in_interval(self) -> float:
-        return self.in_intervals_sum / max(self.num_in - 1, 1)
+        num_intervals = self.num_in - 1 if self.sample_stride == 1 else self.num_in_samples
+        return self.in_intervals_sum / max(num_intervals, 1)
 
     @property
     def mean_out_interval(self) -> float:
-        return self.out_intervals_sum / max(self.num_out - 1, 1)
+        num_intervals = self.num_out - 1 if self.sample_stride == 1 else self.num_out_samples
+        return self.out_intervals_sum / max(num_intervals, 1)
 
     @property
     def mean_queuelen(self) -> float:
@@ -132,14 +157,12 @@ class QueueingMetrics(NodeMetrics):
 
     @property
     def mean_load_per_channel(self) -> dict[int, float]:
-        return {
-            ch: load / max(self.passed_time, TIME_EPS)
-            for ch, load in self.load_time_per_channel.items()
-        }
+        passed_time = max(self.passed_time, TIME_EPS)
+        return {ch: load / passed_time for ch, load in self.load_time_per_channel.items()}
 
     @property
     def mean_channels_load(self) -> float:
-        return sum(self.mean_load_per_channel.values())
+        return sum(self.load_time_per_channel.values()) / max(self.passed_time, TIME_EPS)
 
     @property
     def failure_proba(self) -> float:
@@ -151,10 +174,8 @@ class QueueingMetrics(NodeMetrics):
 
     @property
     def mean_load_time_per_channel(self) -> dict[int, float]:
-        return {
-            ch: load / max(self.num_out, 1)
-            for ch, load in self.load_time_per_channel.items()
-        }
+        num_out = max(self.num_out, 1)
+        return {ch: load / num_out for ch, load in self.load_time_per_channel.items()}
 
     @property
     def mean_blocked_time(self) -> float:
@@ -168,7 +189,7 @@ class QueueingMetrics(NodeMetrics):
 
     @property
     def mean_load_time(self) -> float:
-        return sum(self.mean_load_time_per_channel.values())
+        return sum(self.load_time_per_channel.values()) / max(self.num_out, 1)
 
 
 # Helper functions for common blocking predicates
@@ -185,13 +206,13 @@ def blocking_on_load_threshold(node: "QueueingNode", threshold: float) -> Blocki
     B(S,t) = (downstream load > threshold)
     Block if downstream server utilization exceeds threshold (0.0 to 1.0).
     """
+    # getattr() evaluates the (summing) load property once, where hasattr() + access evaluated it twice
     def predicate() -> bool:
-        if node.next_node is None or not hasattr(node.next_node, 'metrics'):
+        next_node = node.next_node
+        if next_node is None:
             return False
-        metrics = node.next_node.metrics
-        if hasattr(metrics, 'mean_channels_load'):
-            return metrics.mean_channels_load > threshold
-        return False
+        load = getattr(getattr(next_node, 'metrics', None), 'mean_channels_load', None)
+        return load is not None and load > threshold
     return predicate
 
 
@@ -201,9 +222,8 @@ def blocking_on_queue_length(node: "QueueingNode", max_queue: int) -> BlockingPr
     Block if downstream queue reaches or exceeds specified length.
     """
     def predicate() -> bool:
-        if node.next_node is None or not hasattr(node.next_node, 'queuelen'):
-            return False
-        return node.next_node.queuelen >= max_queue
+        queuelen = getattr(node.next_node, 'queuelen', None)
+        return queuelen is not None and queuelen >= max_queue
     return predicate
 
 
@@ -217,20 +237,29 @@ def blocking_on_time_window(node: "QueueingNode", start_time: float, end_time: f
     return predicate
 
 
-@dataclass(order=True, unsafe_hash=True)
-class Task(SupportsDict, Generic[T]):
+class Task(Generic[T]):
     """
     A single service task assigned to some channel, with a predicted finish time next_time.
+    Tasks are ordered by next_time only (that is all the channel pool heap needs)
+    and compared/hashed by identity otherwise.
     """
-    id_gen: ClassVar[Iterator[int]] = itertools.count()
+    __slots__ = ("id", "item", "next_time", "blocked_start_time", "channel")
 
-    id: int = field(init=False, repr=False, compare=False)
-    item: T = field(compare=False)
-    next_time: float
-    blocked_start_time: Optional[float] = field(default=None, compare=False)
+    id_gen: ClassVar[Iterator[int]] = itertools.count()
 
-    def __post_init__(self) -> None:
+    def __init__(self, item: T, next_time: float, blocked_start_time: Optional[float] = None) -> None:
         self.id = next(self.id_gen)
+        self.item = item
+        self.next_time = next_time
+        self.blocked_start_time = blocked_start_time
+        # Id of the channel serving this task while it is in a ChannelPool
+        self.channel: Optional[int] = None
+
+    def __lt__(self, other: "Task[T]") -> bool:
+        return self.next_time < other.next_time
+
+    def __repr__(self) -> str:
+        return f"Task(item={self.item!r}, next_time={self.next_time!r}, blocked_start_time={self.blocked_start_time!r})"
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -240,30 +269,31 @@ class Task(SupportsDict, Generic[T]):
         }
 
 
-@dataclass(eq=False)
-class Channel(SupportsDict, Generic[T]):
+class BlockedTask(NamedTuple):
     """
-    Represents a single service channel (like a server).
+    An item that finished service but is held in its node because the next node could not accept it.
+    A plain named tuple: blocked items are never scheduled, so they need none of Task's ordering or channel.
     """
-    id: int
-
-    def to_dict(self) -> dict[str, Any]:
-        return {"id": self.id}
+    item: Any
+    next_time: float
+    blocked_start_time: Optional[float]
 
 
 class ChannelPool(SupportsDict, Generic[T]):
     """
     Maintains a pool of channels, possibly limited by max_channels.
     Tasks are stored in a MinHeap, keyed by their next_time (finish time).
+
+    Channels are plain integer ids: occupied ones are tracked as bits of `occupied_bits`,
+    released ones are kept on a LIFO stack and reused before new ids are allocated.
     """
 
     def __init__(self, max_channels: Optional[int] = None) -> None:
         self.max_channels = max_channels
         self.tasks = MinHeap[Task[T]](maxlen=max_channels)
-        self.task_to_channel: dict[Task[T], Channel[T]] = {}
-        self.current_id: int = 0
-        self.free_channels = {Channel[T](self.current_id)}
-        self.occupied_channels: set[Channel[T]] = set()
+        self.num_channels: int = 0
+        self.occupied_bits: int = 0
+        self._free_stack: list[int] = []
 
     @property
     def num_active_tasks(self) -> int:
@@ -271,7 +301,24 @@ class ChannelPool(SupportsDict, Generic[T]):
 
     @property
     def num_occupied_channels(self) -> int:
-        return len(self.occupied_channels)
+        return self.num_channels - len(self._free_stack)
+
+    @property
+    def occupied_channels(self) -> tuple[int, ...]:
+        """
+        Ids of the currently occupied channels, in ascending order.
+        """
+        return tuple(self.iter_occupied_channels())
+
+    def iter_occupied_channels(self) -> Iterator[int]:
+        """
+        Iterate over the ids of the occupied channels in ascending order, without building a collection.
+        """
+        bits = self.occupied_bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
 
     @property
     def is_occupied(self) -> bool:
@@ -282,7 +329,7 @@ class ChannelPool(SupportsDict, Generic[T]):
 
     @property
     def is_empty(self) -> bool:
-        return self.num_occupied_channels == 0
+        return self.occupied_bits == 0
 
     @property
     def next_finish_time(self) -> float:
@@ -290,23 +337,21 @@ class ChannelPool(SupportsDict, Generic[T]):
         Return the earliest finishing time among active tasks.
         If there are no tasks, return INF_TIME.
         """
-        nxt_task = self.tasks.min
-        return INF_TIME if nxt_task is None else nxt_task.next_time
+        heap = self.tasks.heap
+        return heap[0].next_time if heap else INF_TIME
 
     def clear(self) -> None:
         self.tasks.clear()
-        self.task_to_channel.clear()
-        self.current_id = 0
-        self.free_channels = {Channel[T](self.current_id)}
-        self.occupied_channels.clear()
+        self.num_channels = 0
+        self.occupied_bits = 0
+        self._free_stack.clear()
 
     def add_task(self, task: Task[T]) -> None:
         """
         Occupy one channel (if available) to handle 'task'.
         """
-        ch = self._occupy_channel()
+        task.channel = self._occupy_channel()
         self.tasks.push(task)
-        self.task_to_channel[task] = ch
 
     def pop_finished_task(self) -> Task[T]:
         """
@@ -314,31 +359,53 @@ class ChannelPool(SupportsDict, Generic[T]):
         (Earliest finishing task).
         """
         task = self.tasks.pop()
-        channel = self.task_to_channel.pop(task)
-        self._free_channel(channel)
+        self._free_channel(task.channel)
+        task.channel = None
         return task
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "max_channels": self.max_channels,
             "tasks": self.tasks,
-            "current_id": self.current_id,
-            "free_channels": self.free_channels,
-            "occupied_channels": self.occupied_channels,
+            "num_channels": self.num_channels,
+            "free_channels": list(reversed(self._free_stack)),
+            "occupied_channels": list(self.iter_occupied_channels()),
         }
 
-    def _occupy_channel(self) -> Channel[T]:
-        ch = self.free_channels.pop()
-        # If free_channels is now empty, attempt to add another channel ID if possible
-        if not self.free_channels and (self.max_channels is None or self.current_id + 1 < self.max_channels):
-            self.current_id += 1
-            self.free_channels.add(Channel[T](self.current_id))
-        self.occupied_channels.add(ch)
-        return ch
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "tasks": list(self.tasks.data),
+            "num_channels": self.num_channels,
+            "occupied_bits": self.occupied_bits,
+            "free_stack": list(self._free_stack),
+        }
 
-    def _free_channel(self, channel: Channel[T]) -> None:
-        self.free_channels.add(channel)
-        self.occupied_channels.remove(channel)
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        self.clear()
+        for task in snapshot["tasks"]:
+            self.tasks.push(task)
+        self.num_channels = snapshot["num_channels"]
+        self.occupied_bits = snapshot["occupied_bits"]
+        self._free_stack.extend(snapshot["free_stack"])
+
+    def _occupy_channel(self) -> int:
+        channel_id = self._free_stack.pop() if self._free_stack else self._grow()
+        self.occupied_bits |= 1 << channel_id
+        return channel_id
+
+    def _free_channel(self, channel_id: int) -> None:
+        self.occupied_bits &= ~(1 << channel_id)
+        self._free_stack.append(channel_id)
+
+    def _grow(self) -> int:
+        """
+        Allocate a brand-new channel id (all previously allocated ids are occupied).
+        """
+        channel_id = self.num_channels
+        if channel_id == self.max_channels:
+            raise RuntimeError(f"Cannot occupy a channel: all {self.max_channels} channels of the pool are busy")
+        self.num_channels += 1
+        return channel_id
 
 
 class QueueingNode(Node[I, QM]):
@@ -350,6 +417,12 @@ class QueueingNode(Node[I, QM]):
     - Integrated blocking predicates
     - Active unblocking notifications
     """
+    __slots__ = (
+        "queue", "channel_pool", "blocked_tasks",
+        "_blocking_strategy", "_handle_blocked_item", "blocking_predicate",
+    )
+
+    counts_as_event: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -363,7 +436,7 @@ class QueueingNode(Node[I, QM]):
         self.queue = queue
         self.channel_pool = channel_pool
         self.next_time = INF_TIME
-        self.blocked_tasks: list[Task[I]] = []
+        self.blocked_tasks: deque[BlockedTask] = deque()
         self.blocking_strategy = blocking_strategy or BlockStrategy()
         
         # Blocking predicate B(S,t): returns True if blocking should occur
@@ -378,6 +451,16 @@ class QueueingNode(Node[I, QM]):
         """
         return itertools.chain(self.queue.data, (tsk.item for tsk in self.channel_pool.tasks.data))
 
+    @property
+    def blocking_strategy(self) -> BlockingStrategy:
+        return self._blocking_strategy
+
+    @blocking_strategy.setter
+    def blocking_strategy(self, blocking_strategy: BlockingStrategy) -> None:
+        self._blocking_strategy = blocking_strategy
+        # Bound once here rather than looked up on the strategy for every blocked completion
+        self._handle_blocked_item = blocking_strategy.handle_blocked_item
+
     @property
     def num_tasks(self) -> int:
         return self.channel_pool.num_active_tasks
@@ -391,32 +474,22 @@ class QueueingNode(Node[I, QM]):
         Check if this node has capacity to accept a new item.
         Returns False if both channels are occupied AND queue is full.
         """
-        # Count blocked tasks as occupying server capacity
-        effective_busy_channels = self.channel_pool.num_occupied_channels + len(self.blocked_tasks)
-        channels_full = False
-        
-        if self.channel_pool.max_channels is not None:
-            if effective_busy_channels >= self.channel_pool.max_channels:
-                channels_full = True
-        
-        if channels_full:
-            return not self.queue.is_full
-        else:
-            return True
+        return not self._channels_full() or not self.queue.is_full
+
+    def _channels_full(self) -> bool:
+        """
+        True if no channel is free, counting blocked tasks as occupying server capacity
+        (effective occupancy = active processing + blocked items).
+        """
+        channel_pool = self.channel_pool
+        max_channels = channel_pool.max_channels
+        return max_channels is not None and channel_pool.num_occupied_channels + len(self.blocked_tasks) >= max_channels
 
     def start_action(self, item: I) -> None:
         super().start_action(item)
-        
-        # Calculate effective occupancy (Active Processing + Blocked Items)
-        effective_busy_channels = self.channel_pool.num_occupied_channels + len(self.blocked_tasks)
-        
-        channels_full = False
-        if self.channel_pool.max_channels is not None:
-            if effective_busy_channels >= self.channel_pool.max_channels:
-                channels_full = True
 
         # If channels are full (physically or blocked), attempt to queue
-        if channels_full:
+        if self._channels_full():
             if self.queue.is_full:
                 self._failure_hook()
             else:
@@ -426,7 +499,7 @@ class QueueingNode(Node[I, QM]):
                 # If we were BUSY, we stay BUSY.
         else:
             # Directly occupy a channel
-            task = Task[I](
+            task = Task(
                 item=item,
                 next_time=self._predict_item_time(item=item)
             )
@@ -445,24 +518,29 @@ class QueueingNode(Node[I, QM]):
         if DEBUG:
             self._validate_blocking_invariants()
         
+        channel_pool = self.channel_pool
+        blocked_tasks = self.blocked_tasks
+        queue = self.queue
+
         # Step 1: Pop finished task
-        finished_task = self.channel_pool.pop_finished_task()
+        finished_task = channel_pool.pop_finished_task()
         finished_item = finished_task.item
         
         # Step 2: Check Blocking Condition
-        will_be_blocked = self._should_block()
+        # (a terminal node never blocks, so it skips the blocking decision entirely)
+        will_be_blocked = self.next_node is not None and self._should_block()
         
         # Step 3: Delegate to Strategy
         if will_be_blocked:
             # === BLOCKING PATH ===
             # The strategy decides if the item is cleared (True) or stuck (False)
-            self.blocking_strategy.handle_blocked_item(self, finished_item)
+            self._handle_blocked_item(self, finished_item)
             # Note: We do NOT return immediately. We might still have a 2nd free channel!
         else:
             # === NORMAL PATH ===
             # The item leaves. Capacity is truly freed.
             # We temporarily set IDLE if empty; add_task will set back to BUSY if we refill.
-            if self.channel_pool.num_active_tasks == 0 and not self.blocked_tasks:
+            if channel_pool.num_active_tasks == 0 and not blocked_tasks:
                 self.state = NodeState.IDLE
                 
             self._end_action(finished_item)
@@ -474,16 +552,9 @@ class QueueingNode(Node[I, QM]):
         # Step 4: Refill from Queue (Only if the strategy cleared the item)
         # We only pull from queue if we have REAL capacity.
         # Capacity = Occupied Channels + Blocked Tasks
-        effective_occupancy = self.channel_pool.num_occupied_channels + len(self.blocked_tasks)
-        can_refill = True
-        
-        if self.channel_pool.max_channels is not None:
-            if effective_occupancy >= self.channel_pool.max_channels:
-                can_refill = False
-        
-        if can_refill and not self.queue.is_empty:
-            nxt_item = self.queue.pop()
-            new_task = Task[I](
+        if not queue.is_empty and not self._channels_full():
+            nxt_item = queue.pop()
+            new_task = Task(
                 item=nxt_item,
                 next_time=self._predict_item_time(item=nxt_item)
             )
@@ -501,28 +572,39 @@ class QueueingNode(Node[I, QM]):
         self.blocked_tasks.clear()
         self.state = NodeState.IDLE
 
-    def try_unblock(self) -> None:
+    def try_unblock(self) -> bool:
         """
         Pull-based unblocking with per-task duration tracking.
         
         Attempts to send blocked tasks to next_node if space becomes available.
         Properly tracks blocking duration for each task individually.
+        Returns True if any of this node's blocked tasks was sent on.
         """
-        if not self.blocked_tasks:
-            self._notify_blocked_predecessors()
-            return
+        did_unblock = self._release_blocked_tasks()
+        self._notify_blocked_predecessors()
+        return did_unblock
+
+    def _release_blocked_tasks(self) -> bool:
+        """
+        Send as many blocked tasks to next_node as it accepts, without notifying predecessors.
+        Returns True if any task was released.
+        """
+        blocked_tasks = self.blocked_tasks
+        if not blocked_tasks:
+            return False
         
-        if self.next_node is None:
-            print(f"WARNING: {self.name} has {len(self.blocked_tasks)} blocked tasks but is terminal. Clearing.")
-            self.blocked_tasks.clear()
-            self._notify_blocked_predecessors()
-            return
+        next_node = self.next_node
+        if next_node is None:
+            log.warning("%s has %d blocked tasks but is terminal. Clearing.", self.name, len(blocked_tasks))
+            blocked_tasks.clear()
+            return False
         
         # Try to unblock as many tasks as possible
         did_unblock = False
+        queue = self.queue
         
-        while self.blocked_tasks and self.next_node.can_accept_item():
-            task = self.blocked_tasks.pop(0)
+        while blocked_tasks and next_node.can_accept_item():
+            task = blocked_tasks.popleft()
             item = task.item
             
             # Metric tracking
@@ -535,11 +617,11 @@ class QueueingNode(Node[I, QM]):
             did_unblock = True
             
             # We must immediately try to fill it from our OWN queue if possible.
-            if not self.queue.is_empty:
+            if not queue.is_empty:
                 # Move item from Queue -> ChannelPool
-                next_item = self.queue.pop()
+                next_item = queue.pop()
                 # We need to wrap it in a task and schedule it
-                new_task = Task[I](
+                new_task = Task(
                     item=next_item,
                     next_time=self._predict_item_time(item=next_item)
                 )
@@ -547,8 +629,8 @@ class QueueingNode(Node[I, QM]):
             
             # Update state after each unblock
             if did_unblock:
-                if not self.blocked_tasks:
-                    self.next_node.blocked_predecessors.discard(self)
+                if not blocked_tasks:
+                    next_node.blocked_predecessors.discard(self)
                     # If we cleared all blocked tasks, we revert to BUSY (if working) or IDLE
                     if self.channel_pool.num_active_tasks > 0:
                         self.state = NodeState.BUSY
@@ -558,23 +640,30 @@ class QueueingNode(Node[I, QM]):
                     # We still have blocked tasks, remain BLOCKED
                     self.state = NodeState.BLOCKED
                     
-        self._notify_blocked_predecessors()
+        return did_unblock
 
     def _notify_blocked_predecessors(self) -> None:
         """
         Actively notify blocked predecessors that space is available.
-        This ensures cascading unblocks in multi-stage networks.
+        This ensures cascading unblocks in multi-stage networks: a predecessor that released tasks
+        has space itself, so its own blocked predecessors are notified next. The cascade runs on a worklist
+        rather than recursion, so long chains of nodes cannot exhaust the stack.
         """
-        if not self.can_accept_item():
-            return  # No space available
-        
-        # Notify all blocked predecessors
-        for blocked_pred in list(self.blocked_predecessors):
-            if hasattr(blocked_pred, 'try_unblock'):
-                blocked_pred.try_unblock()
+        if not self.blocked_predecessors:
+            return  # nothing to notify: the common case after a completion
+        worklist = deque((self,))
+        queued = {self}
+        while worklist:
+            node = worklist.popleft()
+            queued.discard(node)
+            for blocked_pred in list(node.blocked_predecessors):
                 # If we're full again after one unblock, stop notifying
-                if not self.can_accept_item():
+                if not node.can_accept_item():
                     break
+                release_blocked_tasks = getattr(blocked_pred, "_release_blocked_tasks", None)
+                if release_blocked_tasks is not None and release_blocked_tasks() and blocked_pred not in queued:
+                    worklist.append(blocked_pred)
+                    queued.add(blocked_pred)
                 
     # Call in end_action() when DEBUG enabled:
     # if DEBUG:
@@ -656,7 +745,27 @@ class QueueingNode(Node[I, QM]):
         })
         return node_dict
 
+    def snapshot(self) -> dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot.update({
+            "queue": list(self.queue.data),
+            "channel_pool": self.channel_pool.snapshot(),
+            "blocked_tasks": list(self.blocked_tasks),
+        })
+        return snapshot
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        super().restore(snapshot)
+        self.queue.clear()
+        for item in snapshot["queue"]:
+            self.queue.push(item)
+        self.channel_pool.restore(snapshot["channel_pool"])
+        self.blocked_tasks.clear()
+        self.blocked_tasks.extend(snapshot["blocked_tasks"])
+
     def _predict_item_time(self, **kwargs: Any) -> float:
+        if not self.delay_params:
+            return self.current_time + self._delay_fn()
         return self.current_time + self._get_delay(**kwargs)
 
     def _predict_next_time(self, **_: Any) -> float:
@@ -665,27 +774,57 @@ class QueueingNode(Node[I, QM]):
     def _before_time_update_hook(self, time: float) -> None:
         super()._before_time_update_hook(time)
         dtime = time - self.current_time
+        if not dtime:
+            return
+        metrics = self.metrics
         # Add load time to each occupied channel
-        for ch in self.channel_pool.occupied_channels:
-            self.metrics.load_time_per_channel[ch.id] = (
-                self.metrics.load_time_per_channel.get(ch.id, 0) + dtime
-            )
+        load_time_per_channel = metrics.load_time_per_channel
+        for channel_id in self.channel_pool.iter_occupied_channels():
+            load_time_per_channel[channel_id] = load_time_per_channel.get(channel_id, 0) + dtime
         # Accumulate total waiting time
-        self.metrics.total_wait_time += self.queuelen * dtime
+        metrics.total_wait_time += len(self.queue) * dtime
 
     def _item_out_hook(self, item: I) -> None:
         super()._item_out_hook(item)
-        # For out interval
-        if self.metrics.num_out > 1:
-            self.metrics.out_intervals_sum += self.current_time - self.metrics.out_time
-        self.metrics.out_time = self.current_time
+        metrics = self.metrics
+        if metrics.sample_stride == 1:
+            # For out interval: every gap between consecutive departures
+            if metrics.num_out > 1:
+                metrics.out_intervals_sum += self.current_time - metrics.out_time
+            metrics.out_time = self.current_time
+            return
+        # Strided: count down to the (k-1)-th departure, then sample its gap to the k-th one
+        countdown = metrics.out_countdown - 1
+        if countdown > 0:
+            metrics.out_countdown = countdown
+        elif countdown == 0:
+            metrics.out_time = self.current_time
+            metrics.out_countdown = 0
+        else:
+            metrics.out_intervals_sum += self.current_time - metrics.out_time
+            metrics.num_out_samples += 1
+            metrics.out_countdown = metrics.sample_stride - 1
 
     def _item_in_hook(self, item: I) -> None:
         super()._item_in_hook(item)
-        # For in interval
-        if self.metrics.num_in > 1:
-            self.metrics.in_intervals_sum += self.current_time - self.metrics.in_time
-        self.metrics.in_time = self.current_time
+        metrics = self.metrics
+        if metrics.sample_stride == 1:
+            # For in interval: every gap between consecutive arrivals
+            if metrics.num_in > 1:
+                metrics.in_intervals_sum += self.current_time - metrics.in_time
+            metrics.in_time = self.current_time
+            return
+        # Strided: count down to the (k-1)-th arrival, then sample its gap to the k-th one
+        countdown = metrics.in_countdown - 1
+        if countdown > 0:
+            metrics.in_countdown = countdown
+        elif countdown == 0:
+            metrics.in_time = self.current_time
+            metrics.in_countdown = 0
+        else:
+            metrics.in_intervals_sum += self.current_time - metrics.in_time
+            metrics.num_in_samples += 1
+            metrics.in_countdown = metrics.sample_stride - 1
 
     def _before_add_task_hook(self, _: Task[I]) -> None:
         """
@@ -2,6 +2,9 @@
 Model orchestration: runs the simulation by moving time forward to each event.
 """
 
+import io
+import heapq
+import pickle
 import statistics
 from enum import Flag
 from dataclasses import dataclass, field
@@ -11,8 +14,6 @@ import dill
 
 from .core_models import INF_TIME, TIME_EPS, T, I, Metrics
 from .simulation_node import Node, NodeMetrics
-from .item_generator import BaseFactoryNode
-from .service_node import QueueingNode
 
 if TYPE_CHECKING:
     from .results_logger import BaseLogger
@@ -20,6 +21,28 @@ if TYPE_CHECKING:
 MM = TypeVar("MM", bound="ModelMetrics")
 
 
+class _StatePickler(pickle.Pickler):
+    """
+    Pickler that stores nodes as references by name instead of serializing them.
+    """
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return obj.name if isinstance(obj, Node) else None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """
+    Unpickler that resolves node references written by _StatePickler against an existing set of nodes.
+    """
+
+    def __init__(self, file: io.BytesIO, nodes: "Nodes") -> None:
+        super().__init__(file)
+        self.nodes = nodes
+
+    def persistent_load(self, pid: str) -> Node:
+        return self.nodes[pid]
+
+
 class Nodes(dict[str, Node[I, NodeMetrics]]):
     """
     A dictionary-like structure for all nodes in the simulation.
@@ -32,17 +55,17 @@ class Nodes(dict[str, Node[I, NodeMetrics]]):
         Raises ValueError if any node has a duplicate name.
         """
         nodes = Nodes[I]()
-
-        def traverse(node: Node[I, NodeMetrics]) -> None:
+        # Depth-first with an explicit stack (children pushed in reverse to keep the pre-order),
+        # so arbitrarily deep networks do not hit the recursion limit
+        stack = [node_tree_root]
+        while stack:
+            node = stack.pop()
             if node.name in nodes:
-                if nodes[node.name] == node:
-                    return
+                if nodes[node.name] is node:
+                    continue
                 raise ValueError("Nodes must have different names.")
             nodes[node.name] = node
-            for cnode in node.connected_nodes:
-                traverse(cnode)
-
-        traverse(node_tree_root)
+            stack.extend(reversed(list(node.connected_nodes)))
         return nodes
 
 
@@ -143,6 +166,8 @@ class Model(Generic[I, MM]):
         self.evaluations = [] if evaluations is None else evaluations
         self.current_time = 0.0
         self.enable_unblock_safety_net = enable_unblock_safety_net
+        self._event_heap: list[tuple[float, int, Node[I, NodeMetrics]]] = []
+        self._schedule_nodes()
         # Do not collect items here to avoid mutating node internal structures
         # (some node.current_items implementations may expose internal lists).
         # Collection will occur naturally during simulation steps.
@@ -152,7 +177,13 @@ class Model(Generic[I, MM]):
         """
         The simulation time of the next event.
         """
-        return min(INF_TIME, *(nd.next_time for nd in self.nodes.values()))
+        heap = self._event_heap
+        while heap:
+            event_time, _, nd = heap[0]
+            if nd.next_time == event_time:
+                return event_time
+            heapq.heappop(heap)  # outdated entry
+        return INF_TIME
 
     @property
     def model_metrics(self) -> MM:
@@ -182,6 +213,21 @@ class Model(Generic[I, MM]):
         for node in self.nodes.values():
             node.reset()
         self.metrics.reset()
+        self._schedule_nodes()
+
+    def _schedule_nodes(self) -> None:
+        """
+        Attach a fresh event heap to all nodes, filled with their current next_time.
+        Nodes push new entries themselves whenever their next_time is assigned.
+        """
+        heap = []
+        for key, nd in enumerate(self.nodes.values()):
+            nd._event_heap = heap
+            nd._event_key = key
+            if nd.next_time != INF_TIME:
+                heap.append((nd.next_time, key, nd))
+        heapq.heapify(heap)
+        self._event_heap = heap
 
     def simulate(self, end_time: float, verbosity: Verbosity = Verbosity.METRICS) -> None:
         """
@@ -212,25 +258,34 @@ class Model(Generic[I, MM]):
         new_time = min(time, end_time)
         self._before_time_update_hook(new_time)
         self.current_time = new_time
-        for nd in self.nodes.values():
-            nd.update_time(self.current_time)
 
-        # Identify the nodes that have events at the current time
-        end_action_nodes = [
-            nd for nd in self.nodes.values()
-            if abs(self.current_time - nd.next_time) <= TIME_EPS
-        ]
+        for nd in self.nodes.values():
+            nd.update_time(new_time)
+
+        # Pop the nodes with events at the current time from the event heap, skipping outdated entries
+        # (a node can also be scheduled at the same time more than once)
+        heap = self._event_heap
+        end_action_nodes = []
+        while heap and heap[0][0] <= new_time + TIME_EPS:
+            event_time, _, nd = heapq.heappop(heap)
+            if nd.next_time == event_time and abs(new_time - event_time) <= TIME_EPS and nd not in end_action_nodes:
+                end_action_nodes.append(nd)
         
         # --- DETERMINISTIC CONFLICT RESOLUTION ---
         # We sort nodes by name (or ID) to ensure that if multiple events happen 
         # at the exact same time, they are processed in a fixed, reproducible order.
         # This prevents random behavior in deterministic scenarios.
-        end_action_nodes.sort(key=lambda node: node.name)
-        # -----------------------------------------
-        
-        for nd in end_action_nodes:
+        # Most steps have a single firing node, which needs no ordering at all.
+        if len(end_action_nodes) == 1:
+            nd = end_action_nodes[0]
             nd.end_action()
             self._after_node_end_action_hook(nd)
+        else:
+            end_action_nodes.sort(key=lambda node: node.name)
+            for nd in end_action_nodes:
+                nd.end_action()
+                self._after_node_end_action_hook(nd)
+        # -----------------------------------------
 
         # SAFETY NET: Try to unblock any remaining blocked nodes
         # This handles edge cases where unblocking notifications might be missed
@@ -257,11 +312,8 @@ class Model(Generic[I, MM]):
             
             # Try to unblock all nodes that have blocked tasks
             for nd in self.nodes.values():
-                if hasattr(nd, 'try_unblock') and hasattr(nd, 'blocked_tasks'):
-                    initial_blocked = len(nd.blocked_tasks)
-                    nd.try_unblock()
-                    if len(nd.blocked_tasks) < initial_blocked:
-                        progress_made = True
+                if hasattr(nd, 'try_unblock') and nd.try_unblock():
+                    progress_made = True
             
             # Try to notify all nodes that might have blocked predecessors
             for nd in self.nodes.values():
@@ -294,8 +346,32 @@ class Model(Generic[I, MM]):
         Called after a node completes an event, possibly updating the overall event count.
         """
         # Factory or queueing nodes create "events" (arrivals or completions).
-        if isinstance(node, (BaseFactoryNode, QueueingNode)):
-            self.metrics.num_events += 1
+        self.metrics.num_events += node.counts_as_event
+
+    def save_state(self) -> bytes:
+        """
+        Serialize only the mutable simulation state (clocks, metrics, queued and in-service items)
+        using the stdlib pickle. Nodes are stored by name, so delay functions and the topology
+        are not serialized; use load_state() on a model built with the same nodes.
+        """
+        buffer = io.BytesIO()
+        _StatePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump({
+            "current_time": self.current_time,
+            "metrics": self.metrics,
+            "nodes": {name: nd.snapshot() for name, nd in self.nodes.items()},
+        })
+        return buffer.getvalue()
+
+    def load_state(self, state_bytes: bytes) -> None:
+        """
+        Restore the simulation state saved by save_state().
+        """
+        state = _StateUnpickler(io.BytesIO(state_bytes), self.nodes).load()
+        self.current_time = state["current_time"]
+        self.metrics = state["metrics"]
+        for name, snapshot in state["nodes"].items():
+            self.nodes[name].restore(snapshot)
+        self._schedule_nodes()
 
     def dumps(self) -> bytes:
         """
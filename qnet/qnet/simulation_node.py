@@ -2,14 +2,15 @@
 Base Node classes: all nodes must inherit from Node, implementing start_action() and end_action().
 """
 
-from abc import ABC, abstractmethod
+import sys
+import heapq
 import inspect
+from weakref import WeakKeyDictionary
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Generic, Iterable, Optional, TypeVar, Any, cast
+from typing import Callable, ClassVar, Generic, Iterable, Iterator, Optional, TypeVar, Any, cast
 
-from .core_models import I, SupportsDict, Metrics, ActionRecord, ActionType
-from .helpers import filter_none
+from .core_models import DATACLASS_SLOTS, INF_TIME, I, Metrics, ActionRecord, ActionType
 
 
 class NodeState(Enum):
@@ -28,20 +29,42 @@ class NodeState(Enum):
 NM = TypeVar("NM", bound="NodeMetrics")
 DelayFn = Callable[..., float]
 
+# Enum members resolved once, for the history records written on every arrival/departure
+_IN = ActionType.IN
+_OUT = ActionType.OUT
 
-@dataclass(eq=False)
+# Parameter names per delay function: nodes commonly share one delay_fn, so its signature is inspected only once.
+# Weak keys (rather than functools.lru_cache) so the cache never keeps a delay_fn and its closure alive.
+_delay_params_cache: "WeakKeyDictionary[DelayFn, frozenset[str]]" = WeakKeyDictionary()
+
+
+def _delay_params(delay_fn: DelayFn) -> frozenset[str]:
+    """
+    Names of the parameters accepted by `delay_fn`.
+    """
+    try:
+        params = _delay_params_cache.get(delay_fn)
+    except TypeError:  # not weak-referenceable or unhashable: inspect without caching
+        return frozenset(inspect.signature(delay_fn).parameters)
+    if params is None:
+        params = _delay_params_cache[delay_fn] = frozenset(inspect.signature(delay_fn).parameters)
+    return params
+
+
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class NodeMetrics(Metrics):
     """
     Basic metrics for a node: number of arrivals/departures, time tracking for last events, etc.
     """
-    node_name: str = field(init=False, default="")
+    # Counters updated on every event come first
     num_in: int = field(init=False, default=0)
     num_out: int = field(init=False, default=0)
     start_action_time: float = field(init=False, default=-1)
     end_action_time: float = field(init=False, default=-1)
+    node_name: str = field(init=False, default="")
 
     def to_dict(self) -> dict[str, Any]:
-        metrics_dict = super().to_dict()
+        metrics_dict = Metrics.to_dict(self)
         metrics_dict.update({
             "num_in": self.num_in,
             "num_out": self.num_out
@@ -49,9 +72,76 @@ class NodeMetrics(Metrics):
         return metrics_dict
 
 
-class Node(ABC, SupportsDict, Generic[I, NM]):
+class BlockedPredecessors:
+    """
+    FIFO set of the nodes blocked while trying to send items to one node.
+
+    The list is intrusive: its links live on the blocked nodes themselves
+    (_blocked_on, _blocked_prev, _blocked_next), so adding and removing a node is O(1)
+    without hashing or allocating an entry. A node is blocked on at most one list at a time.
+    """
+
+    __slots__ = ("head", "tail", "size")
+
+    def __init__(self) -> None:
+        self.head: Optional["Node"] = None
+        self.tail: Optional["Node"] = None
+        self.size: int = 0
+
+    def __contains__(self, node: object) -> bool:
+        return getattr(node, "_blocked_on", None) is self
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator["Node"]:
+        node = self.head
+        while node is not None:
+            next_node = node._blocked_next
+            yield node
+            node = next_node
+
+    def add(self, node: "Node") -> None:
+        if node._blocked_on is self:
+            return
+        if node._blocked_on is not None:
+            node._blocked_on.discard(node)
+        node._blocked_on = self
+        node._blocked_prev = self.tail
+        node._blocked_next = None
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail._blocked_next = node
+        self.tail = node
+        self.size += 1
+
+    def discard(self, node: "Node") -> None:
+        if node._blocked_on is not self:
+            return
+        prev_node, next_node = node._blocked_prev, node._blocked_next
+        if prev_node is None:
+            self.head = next_node
+        else:
+            prev_node._blocked_next = next_node
+        if next_node is None:
+            self.tail = prev_node
+        else:
+            next_node._blocked_prev = prev_node
+        node._blocked_on = node._blocked_prev = node._blocked_next = None
+        self.size -= 1
+
+    def clear(self) -> None:
+        for node in self:
+            node._blocked_on = node._blocked_prev = node._blocked_next = None
+        self.head = self.tail = None
+        self.size = 0
+
+
+class Node(Generic[I, NM]):
     """
-    Abstract Node in a queueing network.
+    Abstract Node in a queueing network (satisfies SupportsDict).
+    A plain class rather than an ABC: subclasses must override end_action(), checked once in __init__.
     
     Three-state model:
     - IDLE: Not processing, no blocked items
@@ -59,7 +149,18 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
     - BLOCKED: Finished processing, but cannot send to next_node (next_node is full)
     """
 
+    __slots__ = (
+        "_delay_fn", "delay_params", "_get_delay", "metrics", "name", "node_index",
+        "next_node", "prev_node", "record_history", "current_time", "_next_time", "state",
+        "_event_heap", "_event_key", "blocked_predecessors", "_blocked_on", "_blocked_prev", "_blocked_next",
+    )
+
+    # Number of nodes created per class, used for auto-generated names
     num_nodes: int = 0
+    # Default for `record_history`: record an ActionRecord in item.history on every arrival/departure
+    trace_history: ClassVar[bool] = False
+    # Whether an end_action of this node counts towards ModelMetrics.num_events
+    counts_as_event: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -67,29 +168,70 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
         metrics: NM,
         name: Optional[str] = None,
         next_node: Optional["Node[I, NodeMetrics]"] = None,
+        record_history: Optional[bool] = None,
     ) -> None:
-        self.num_nodes += 1
+        cls = type(self)
+        if cls.end_action is Node.end_action:
+            raise TypeError(f"Can't instantiate {cls.__name__} without an end_action() implementation")
+        cls.num_nodes += 1
+        self.node_index = cls.num_nodes
         self.delay_fn = delay_fn
-        self.delay_params = inspect.signature(self.delay_fn).parameters
         self.metrics = metrics
-        self.name = self._get_auto_name() if name is None else name
+        # Names are interned, as they are used as dictionary keys throughout (Nodes, loggers, state snapshots)
+        self.name = sys.intern(self._get_auto_name() if name is None else name)
         self.metrics.node_name = self.name
         self.next_node = next_node
+        self.record_history = self.trace_history if record_history is None else record_history
         self.prev_node: Optional[Node[I, NodeMetrics]] = None
         self.current_time: float = 0.0
-        self.next_time: float = 0.0
+        # Event heap of the model this node belongs to, see next_time
+        self._event_heap: Optional[list[tuple[float, int, Node[I, NodeMetrics]]]] = None
+        self._event_key = 0
+        self._next_time = 0.0
         self.state: NodeState = NodeState.IDLE
         
         # Nodes that are blocked trying to send items to this node
         # Used for pull-based unblocking: when this node frees space, it notifies blocked predecessors
-        self.blocked_predecessors: set["Node[I, NodeMetrics]"] = set()
+        self.blocked_predecessors = BlockedPredecessors()
+        # Links of this node in the BlockedPredecessors list of the node it is blocked on
+        self._blocked_on: Optional[BlockedPredecessors] = None
+        self._blocked_prev: Optional[Node[I, NodeMetrics]] = None
+        self._blocked_next: Optional[Node[I, NodeMetrics]] = None
+
+    @property
+    def delay_fn(self) -> DelayFn:
+        return self._delay_fn
+
+    @delay_fn.setter
+    def delay_fn(self, delay_fn: DelayFn) -> None:
+        self._delay_fn = delay_fn
+        self.delay_params = _delay_params(delay_fn)
+        # Rebound on every assignment, so a replaced delay_fn takes effect on the next event
+        self._get_delay = self._bind_get_delay()
+
+    @property
+    def next_time(self) -> float:
+        """
+        The simulation time of this node's next event.
+        """
+        return self._next_time
+
+    @next_time.setter
+    def next_time(self, next_time: float) -> None:
+        self._next_time = next_time
+        # Schedule the event in the model; entries outdated by later assignments are skipped by the model lazily
+        if self._event_heap is not None and next_time != INF_TIME:
+            heapq.heappush(self._event_heap, (next_time, self._event_key, self))
 
     @property
     def connected_nodes(self) -> Iterable["Node[I, NodeMetrics]"]:
         """
         All nodes that are connected to this node by next_node or prev_node.
         """
-        return filter_none((self.prev_node, self.next_node))
+        prev_node, next_node = self.prev_node, self.next_node
+        if prev_node is None:
+            return () if next_node is None else (next_node,)
+        return (prev_node,) if next_node is None else (prev_node, next_node)
 
     @property
     def current_items(self) -> Iterable[I]:
@@ -112,9 +254,9 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
         """
         self._item_in_hook(item)
         self.metrics.start_action_time = self.current_time
-        item.history.append(ActionRecord(self, ActionType.IN, self.current_time))
+        if self.record_history:
+            item.history.append(ActionRecord(self, _IN, self.current_time))
 
-    @abstractmethod
     def end_action(self) -> I:
         """
         Called when this node finishes processing its current item (if any).
@@ -125,11 +267,10 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
     def update_time(self, time: float) -> None:
         """
         Update the node's internal clock to `time`.
+        Items are not touched here: their current_time is stamped when they enter or leave a node.
         """
         self._before_time_update_hook(time)
         self.current_time = time
-        for itm in self.current_items:
-            itm.current_time = time
 
     def set_next_node(self, node: Optional["Node[I, NodeMetrics]"]) -> None:
         """
@@ -155,16 +296,56 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
     def to_dict(self) -> dict[str, Any]:
         return {"next_time": self.next_time}
 
+    def snapshot(self) -> dict[str, Any]:
+        """
+        The mutable simulation state of the node: clocks, metrics and held items,
+        but not its delay function or links to other nodes (see Model.save_state()).
+        """
+        return {
+            "current_time": self.current_time,
+            "next_time": self.next_time,
+            "state": self.state,
+            "metrics": self.metrics,
+            "blocked_predecessors": list(self.blocked_predecessors),
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """
+        Load the state previously captured by snapshot().
+        """
+        self.current_time = snapshot["current_time"]
+        self.next_time = snapshot["next_time"]
+        self.state = snapshot["state"]
+        self.metrics = snapshot["metrics"]
+        self.blocked_predecessors.clear()
+        for node in snapshot["blocked_predecessors"]:
+            self.blocked_predecessors.add(node)
+
     def _get_auto_name(self) -> str:
-        return f"{self.__class__.__name__}{self.num_nodes}"
+        return f"{self.__class__.__name__}{self.node_index}"
 
-    def _get_delay(self, **kwargs: Any) -> float:
-        return self.delay_fn(**{
-            name: value for name, value in kwargs.items()
-            if name in self.delay_params
+    def _bind_get_delay(self) -> DelayFn:
+        """
+        Build the delay getter once, specialized to the parameters delay_fn accepts,
+        so that the per-event call does not filter its kwargs against the signature.
+        """
+        delay_fn = self._delay_fn
+        param_set = self.delay_params
+        if not param_set:
+            return lambda **_: delay_fn()
+        if param_set == {"item"}:
+            return lambda **kwargs: delay_fn(item=kwargs["item"]) if "item" in kwargs else delay_fn()
+        # Pick the few accepted names out of kwargs, rather than testing every passed name against the set
+        param_names = tuple(param_set)
+        return lambda **kwargs: delay_fn(**{
+            name: kwargs[name] for name in param_names
+            if name in kwargs
         })
 
     def _predict_next_time(self, **kwargs: Any) -> float:
+        # A zero-argument delay_fn is called directly, without passing kwargs through _get_delay
+        if not self.delay_params:
+            return self.current_time + self._delay_fn()
         return self.current_time + self._get_delay(**kwargs)
 
     def _end_action(self, item: I) -> I:
@@ -173,7 +354,8 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
         """
         self._item_out_hook(item)
         self.metrics.end_action_time = self.current_time
-        item.history.append(ActionRecord(self, ActionType.OUT, self.current_time))
+        if self.record_history:
+            item.history.append(ActionRecord(self, _OUT, self.current_time))
         self._start_next_action(item)
         return item
 
@@ -186,11 +368,13 @@ class Node(ABC, SupportsDict, Generic[I, NM]):
         else:
             self.next_node.start_action(item)
 
-    def _item_in_hook(self, _: I) -> None:
+    def _item_in_hook(self, item: I) -> None:
         self.metrics.num_in += 1
+        item.current_time = self.current_time
 
-    def _item_out_hook(self, _: I) -> None:
+    def _item_out_hook(self, item: I) -> None:
         self.metrics.num_out += 1
+        item.current_time = self.current_time
 
     def _before_time_update_hook(self, time: float) -> None:
         self.metrics.passed_time += time - self.current_time
@@ -0,0 +1,5 @@
+from logging_setup import configure_logging
+
+
+def pytest_configure(config):
+    configure_logging()
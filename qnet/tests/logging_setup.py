@@ -0,0 +1,18 @@
+"""
+Logging for the test modules.
+
+Each test module logs its traces and per-test confirmations on its own `logging.getLogger(__name__)`.
+They are silent unless the LOGLEVEL environment variable is set, e.g. `LOGLEVEL=DEBUG`.
+"""
+
+import logging
+import os
+
+
+def configure_logging() -> None:
+    """
+    Print test log messages at the level given by LOGLEVEL, if it is set.
+    """
+    level = os.environ.get("LOGLEVEL")
+    if level:
+        logging.basicConfig(level=level.upper(), format="%(message)s")
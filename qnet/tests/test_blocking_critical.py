@@ -3,6 +3,7 @@ Critical Blocking Tests - Runnable Implementation
 These tests validate the most important aspects of blocking logic
 """
 
+import logging
 import unittest
 from dataclasses import dataclass, field
 from typing import List, Any
@@ -18,6 +19,9 @@ except ImportError:
     IMPORTS_AVAILABLE = False
     print("Warning: QNet imports not available. Tests will be skipped.")
 
+# Step-by-step traces of the scenarios; silent unless LOGLEVEL is set (see logging_setup.py)
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class TestItem:
@@ -67,9 +71,9 @@ class TestCriticalBlocking(unittest.TestCase):
         Action: A finishes item
         Result: A enters BLOCKED state
         """
-        print("\n" + "="*60)
-        print("TEST 1: Basic Blocking")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 1: Basic Blocking")
+        log.debug("="*60)
         
         # Create nodes
         node_b = self.create_node("B", channels=1, queue_size=0)
@@ -79,19 +83,19 @@ class TestCriticalBlocking(unittest.TestCase):
         # Fill B
         item_blocker = self.create_item("Blocker")
         node_b.start_action(item_blocker)
-        print(f"B state after filling: {node_b.state}")
+        log.debug("B state after filling: %s", node_b.state)
         self.assertFalse(node_b.can_accept_item(), "B should be full")
         
         # Process item in A
         item_a = self.create_item("ItemA")
         node_a.start_action(item_a)
-        print(f"A state after start: {node_a.state}")
+        log.debug("A state after start: %s", node_a.state)
         
         # A finishes - should block
         finished = node_a.end_action()
-        print(f"A state after end: {node_a.state}")
-        print(f"A blocked_tasks: {len(node_a.blocked_tasks)}")
-        print(f"A is in B.blocked_predecessors: {node_a in node_b.blocked_predecessors}")
+        log.debug("A state after end: %s", node_a.state)
+        log.debug("A blocked_tasks: %s", len(node_a.blocked_tasks))
+        log.debug("A is in B.blocked_predecessors: %s", node_a in node_b.blocked_predecessors)
         
         # CRITICAL ASSERTIONS
         self.assertEqual(node_a.state, NodeState.BLOCKED, "A must be BLOCKED")
@@ -99,7 +103,7 @@ class TestCriticalBlocking(unittest.TestCase):
         self.assertIn(node_a, node_b.blocked_predecessors, "A must be registered with B")
         self.assertEqual(node_a.metrics.num_blocks, 1, "num_blocks must be 1")
         
-        print("✓ Basic blocking works correctly")
+        log.debug("✓ Basic blocking works correctly")
     
     def test_02_unblocking_restores_flow(self):
         """
@@ -109,9 +113,9 @@ class TestCriticalBlocking(unittest.TestCase):
         Action: B finishes and frees space
         Result: A unblocks and sends item
         """
-        print("\n" + "="*60)
-        print("TEST 2: Unblocking")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 2: Unblocking")
+        log.debug("="*60)
         
         # Setup from test_01
         node_b = self.create_node("B", channels=1, queue_size=0)
@@ -127,7 +131,7 @@ class TestCriticalBlocking(unittest.TestCase):
         node_a.start_action(item_a)
         node_a.end_action()
         
-        print(f"Initial: A.state={node_a.state}, A.blocked_tasks={len(node_a.blocked_tasks)}")
+        log.debug("Initial: A.state=%s, A.blocked_tasks=%s", node_a.state, len(node_a.blocked_tasks))
         
         # Advance time
         node_a.current_time = 10.0
@@ -136,13 +140,13 @@ class TestCriticalBlocking(unittest.TestCase):
         # B finishes - this should trigger unblocking
         node_b.end_action()
         
-        print(f"After B finishes: B.can_accept={node_b.can_accept_item()}")
+        log.debug("After B finishes: B.can_accept=%s", node_b.can_accept_item())
         
         # A should try to unblock
         node_a.try_unblock()
         
-        print(f"After unblock: A.state={node_a.state}, A.blocked_tasks={len(node_a.blocked_tasks)}")
-        print(f"B now has {node_b.num_tasks} tasks")
+        log.debug("After unblock: A.state=%s, A.blocked_tasks=%s", node_a.state, len(node_a.blocked_tasks))
+        log.debug("B now has %s tasks", node_b.num_tasks)
         
         # CRITICAL ASSERTIONS
         self.assertEqual(len(node_a.blocked_tasks), 0, "A should have no blocked tasks")
@@ -150,7 +154,7 @@ class TestCriticalBlocking(unittest.TestCase):
         self.assertEqual(node_b.num_tasks, 1, "B should have received the item")
         self.assertNotIn(node_a, node_b.blocked_predecessors, "A should be removed from blocked_predecessors")
         
-        print("✓ Unblocking works correctly")
+        log.debug("✓ Unblocking works correctly")
     
     def test_03_per_task_blocking_duration(self):
         """
@@ -158,9 +162,9 @@ class TestCriticalBlocking(unittest.TestCase):
         
         This was the main bug in the original implementation.
         """
-        print("\n" + "="*60)
-        print("TEST 3: Per-Task Blocking Duration")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 3: Per-Task Blocking Duration")
+        log.debug("="*60)
         
         node_b = self.create_node("B", channels=1, queue_size=0)
         node_a = self.create_node("A", channels=2, queue_size=0)  # 2 channels
@@ -176,7 +180,7 @@ class TestCriticalBlocking(unittest.TestCase):
         item1.created_time = 10.0
         node_a.start_action(item1)
         node_a.end_action()
-        print(f"t=10: Blocked Item1")
+        log.debug("t=10: Blocked Item1")
         
         # Block second item at t=15
         node_a.current_time = 15.0
@@ -185,7 +189,7 @@ class TestCriticalBlocking(unittest.TestCase):
         item2.created_time = 15.0
         node_a.start_action(item2)
         node_a.end_action()
-        print(f"t=15: Blocked Item2")
+        log.debug("t=15: Blocked Item2")
         
         self.assertEqual(len(node_a.blocked_tasks), 2, "Should have 2 blocked tasks")
         
@@ -195,7 +199,7 @@ class TestCriticalBlocking(unittest.TestCase):
         node_b.end_action()  # Free space
         node_a.try_unblock()
         
-        print(f"t=20: Unblocked Item1, blocked_time={node_a.metrics.blocked_time}")
+        log.debug("t=20: Unblocked Item1, blocked_time=%s", node_a.metrics.blocked_time)
         self.assertEqual(node_a.metrics.blocked_time, 10.0, "First task blocked for 10 time units")
         self.assertEqual(len(node_a.blocked_tasks), 1, "Should have 1 blocked task remaining")
         
@@ -205,7 +209,7 @@ class TestCriticalBlocking(unittest.TestCase):
         node_b.end_action()  # Free space again
         node_a.try_unblock()
         
-        print(f"t=30: Unblocked Item2, blocked_time={node_a.metrics.blocked_time}")
+        log.debug("t=30: Unblocked Item2, blocked_time=%s", node_a.metrics.blocked_time)
         
         # CRITICAL: Total blocked time should be 10 + 15 = 25
         # NOT (30 - 10) = 20 (global tracking bug)
@@ -215,7 +219,7 @@ class TestCriticalBlocking(unittest.TestCase):
         self.assertEqual(node_a.metrics.mean_blocked_time, 12.5, 
                         "Mean blocked time should be 25/2 = 12.5")
         
-        print("✓ Per-task blocking duration works correctly")
+        log.debug("✓ Per-task blocking duration works correctly")
     
     def test_04_capacity_with_blocked_tasks(self):
         """
@@ -224,9 +228,9 @@ class TestCriticalBlocking(unittest.TestCase):
         Setup: Node with 2 channels, 1 active, 1 blocked
         Result: Node should report as full (can't accept without queue space)
         """
-        print("\n" + "="*60)
-        print("TEST 4: Capacity Accounting")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 4: Capacity Accounting")
+        log.debug("="*60)
         
         node_b = self.create_node("B", channels=1, queue_size=0)
         node_a = self.create_node("A", channels=2, queue_size=0)  # 2 channels, NO queue
@@ -239,19 +243,19 @@ class TestCriticalBlocking(unittest.TestCase):
         # Start one item in A (channel 1)
         item1 = self.create_item("Item1")
         node_a.start_action(item1)
-        print(f"After starting Item1: can_accept={node_a.can_accept_item()}")
+        log.debug("After starting Item1: can_accept=%s", node_a.can_accept_item())
         self.assertTrue(node_a.can_accept_item(), "Should still accept (1/2 channels used)")
         
         # Finish and block (channel 1 now has blocked task)
         node_a.end_action()
-        print(f"After blocking Item1: can_accept={node_a.can_accept_item()}")
-        print(f"  Active channels: {node_a.channel_pool.num_occupied_channels}")
-        print(f"  Blocked tasks: {len(node_a.blocked_tasks)}")
+        log.debug("After blocking Item1: can_accept=%s", node_a.can_accept_item())
+        log.debug("  Active channels: %s", node_a.channel_pool.num_occupied_channels)
+        log.debug("  Blocked tasks: %s", len(node_a.blocked_tasks))
         
         # Start another item (channel 2)
         item2 = self.create_item("Item2")
         node_a.start_action(item2)
-        print(f"After starting Item2: can_accept={node_a.can_accept_item()}")
+        log.debug("After starting Item2: can_accept=%s", node_a.can_accept_item())
         
         # CRITICAL: Now we have 1 active + 1 blocked = 2/2 channels occupied
         # With no queue space, should NOT accept more items
@@ -266,7 +270,7 @@ class TestCriticalBlocking(unittest.TestCase):
         self.assertEqual(node_a.metrics.num_failures, initial_failures + 1,
                         "Should reject item when full")
         
-        print("✓ Capacity accounting works correctly")
+        log.debug("✓ Capacity accounting works correctly")
     
     def test_05_cascading_unblock_chain(self):
         """
@@ -276,9 +280,9 @@ class TestCriticalBlocking(unittest.TestCase):
         Action: C frees space
         Result: B unblocks, then A unblocks
         """
-        print("\n" + "="*60)
-        print("TEST 5: Cascading Unblock")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 5: Cascading Unblock")
+        log.debug("="*60)
         
         # Create chain
         node_c = self.create_node("C", channels=1, queue_size=0)
@@ -296,13 +300,13 @@ class TestCriticalBlocking(unittest.TestCase):
         item_b = self.create_item("ItemB")
         node_b.start_action(item_b)
         node_b.end_action()
-        print(f"B blocked: {node_b.state}")
+        log.debug("B blocked: %s", node_b.state)
         
         # Block A
         item_a = self.create_item("ItemA")
         node_a.start_action(item_a)
         node_a.end_action()
-        print(f"A blocked: {node_a.state}")
+        log.debug("A blocked: %s", node_a.state)
         
         # Verify initial state
         self.assertEqual(node_b.state, NodeState.BLOCKED)
@@ -314,30 +318,30 @@ class TestCriticalBlocking(unittest.TestCase):
         node_a.current_time = 10.0
         
         node_c.end_action()
-        print(f"After C finishes: C.can_accept={node_c.can_accept_item()}")
+        log.debug("After C finishes: C.can_accept=%s", node_c.can_accept_item())
         
         # B should unblock
         node_b.try_unblock()
-        print(f"After B.try_unblock: B.state={node_b.state}, B.blocked_tasks={len(node_b.blocked_tasks)}")
+        log.debug("After B.try_unblock: B.state=%s, B.blocked_tasks=%s", node_b.state, len(node_b.blocked_tasks))
         
         # A should unblock
         node_a.try_unblock()
-        print(f"After A.try_unblock: A.state={node_a.state}, A.blocked_tasks={len(node_a.blocked_tasks)}")
+        log.debug("After A.try_unblock: A.state=%s, A.blocked_tasks=%s", node_a.state, len(node_a.blocked_tasks))
         
         # CRITICAL ASSERTIONS
         self.assertEqual(len(node_b.blocked_tasks), 0, "B should be unblocked")
         self.assertEqual(len(node_a.blocked_tasks), 0, "A should be unblocked")
         self.assertEqual(node_c.num_tasks, 1, "C should have ItemB")
         
-        print("✓ Cascading unblock works correctly")
+        log.debug("✓ Cascading unblock works correctly")
     
     def test_06_fifo_unblock_order(self):
         """
         CRITICAL: Blocked items unblock in FIFO order.
         """
-        print("\n" + "="*60)
-        print("TEST 6: FIFO Unblock Order")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 6: FIFO Unblock Order")
+        log.debug("="*60)
         
         node_b = self.create_node("B", channels=1, queue_size=0)
         node_a = self.create_node("A", channels=3, queue_size=0)  # 3 channels
@@ -356,7 +360,8 @@ class TestCriticalBlocking(unittest.TestCase):
             node_a.start_action(item)
             node_a.end_action()
         
-        print(f"Blocked items: {[t.item.name for t in node_a.blocked_tasks]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Blocked items: %s", [t.item.name for t in node_a.blocked_tasks])
         self.assertEqual(len(node_a.blocked_tasks), 3)
         
         # Verify order
@@ -370,7 +375,8 @@ class TestCriticalBlocking(unittest.TestCase):
         node_b.end_action()
         node_a.try_unblock()
         
-        print(f"After unblock 1: {[t.item.name for t in node_a.blocked_tasks]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("After unblock 1: %s", [t.item.name for t in node_a.blocked_tasks])
         
         # CRITICAL: Item0 should have unblocked (FIFO)
         self.assertEqual(len(node_a.blocked_tasks), 2)
@@ -380,21 +386,22 @@ class TestCriticalBlocking(unittest.TestCase):
         node_b.end_action()
         node_a.try_unblock()
         
-        print(f"After unblock 2: {[t.item.name for t in node_a.blocked_tasks]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("After unblock 2: %s", [t.item.name for t in node_a.blocked_tasks])
         
         # Item1 should have unblocked
         self.assertEqual(len(node_a.blocked_tasks), 1)
         self.assertEqual(node_a.blocked_tasks[0].item.name, "Item2", "Item2 should be last")
         
-        print("✓ FIFO unblock order maintained")
+        log.debug("✓ FIFO unblock order maintained")
     
     def test_07_max_blocked_tasks_metric(self):
         """
         Test max_blocked_tasks metric.
         """
-        print("\n" + "="*60)
-        print("TEST 7: Max Blocked Tasks Metric")
-        print("="*60)
+        log.debug("="*60)
+        log.debug("TEST 7: Max Blocked Tasks Metric")
+        log.debug("="*60)
         
         node_b = self.create_node("B", channels=1, queue_size=0)
         node_a = self.create_node("A", channels=10, queue_size=0)
@@ -409,7 +416,7 @@ class TestCriticalBlocking(unittest.TestCase):
             node_a.start_action(item)
             node_a.end_action()
         
-        print(f"After 5 blocks: max_blocked_tasks={node_a.metrics.max_blocked_tasks}")
+        log.debug("After 5 blocks: max_blocked_tasks=%s", node_a.metrics.max_blocked_tasks)
         self.assertEqual(node_a.metrics.max_blocked_tasks, 5)
         self.assertEqual(len(node_a.blocked_tasks), 5)
         
@@ -424,7 +431,7 @@ class TestCriticalBlocking(unittest.TestCase):
         node_b.end_action()
         node_a.try_unblock()
         
-        print(f"After 2 unblocks: blocked_tasks={len(node_a.blocked_tasks)}, max={node_a.metrics.max_blocked_tasks}")
+        log.debug("After 2 unblocks: blocked_tasks=%s, max=%s", len(node_a.blocked_tasks), node_a.metrics.max_blocked_tasks)
         self.assertEqual(len(node_a.blocked_tasks), 3)
         self.assertEqual(node_a.metrics.max_blocked_tasks, 5, "Max should still be 5")
         
@@ -446,11 +453,11 @@ class TestCriticalBlocking(unittest.TestCase):
                 node_a.end_action()
                 successful_blocks += 1
             else:
-                print(f"  NewItem{i} was rejected (node full)")
+                log.debug("  NewItem%s was rejected (node full)", i)
         
-        print(f"Successfully blocked {successful_blocks} new items")
-        print(f"Current blocked_tasks: {len(node_a.blocked_tasks)}")
-        print(f"New max: {node_a.metrics.max_blocked_tasks}")
+        log.debug("Successfully blocked %s new items", successful_blocks)
+        log.debug("Current blocked_tasks: %s", len(node_a.blocked_tasks))
+        log.debug("New max: %s", node_a.metrics.max_blocked_tasks)
         
         # Now we should have 3 + 2 = 5 blocked (unless some were rejected)
         # Max should update if we exceeded 5
@@ -463,11 +470,13 @@ class TestCriticalBlocking(unittest.TestCase):
             # Peak is still 5 (we had 5, dropped to 3, added 2 → back to 5)
             self.assertEqual(node_a.metrics.max_blocked_tasks, 5)
         
-        print("✓ Max blocked tasks metric works correctly")
+        log.debug("✓ Max blocked tasks metric works correctly")
 
 
 if __name__ == '__main__':
     # Run with verbose output
+    from logging_setup import configure_logging
+    configure_logging()
     suite = unittest.TestLoader().loadTestsFromTestCase(TestCriticalBlocking)
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
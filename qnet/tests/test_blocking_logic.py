@@ -8,7 +8,6 @@ from qnet.service_node import (
     ChannelPool,
     QueueingMetrics,
     Task,
-    Channel,
     blocking_on_queue_length,
     blocking_on_capacity,
 )
@@ -174,6 +173,22 @@ class TestBlockingLogic(unittest.TestCase):
         self.assertEqual(len(node_a.blocked_tasks), 0)
         self.assertEqual(len(node_b.blocked_tasks), 0)
 
+    def test_long_cascade_unblocking(self):
+        # A chain of zero-buffer nodes, each blocked on its successor, longer than the recursion limit
+        nodes = [self.create_node(f"N{i}", queue_size=0) for i in range(2000)]
+        for node, next_node in zip(nodes, nodes[1:]):
+            node.set_next_node(next_node)
+        for i, node in reversed(list(enumerate(nodes))):
+            node.start_action(TestItem("Item", id=i))
+            if node.next_node is not None:
+                node.end_action()
+                self.assertEqual(node.state, NodeState.BLOCKED)
+
+        nodes[-1].end_action()
+
+        self.assertTrue(all(len(node.blocked_tasks) == 0 for node in nodes))
+        self.assertTrue(all(node.state == NodeState.BUSY for node in nodes[1:]))
+
     def test_blocking_on_capacity_predicate(self):
         # blocking_on_capacity should block when next node cannot accept
         node_b = self.create_node("B", channels=1, queue_size=0, delay=0.0)
@@ -188,6 +203,24 @@ class TestBlockingLogic(unittest.TestCase):
 
         self.assertEqual(node_a.state, NodeState.BLOCKED)
 
+    def test_blocked_predecessors_fifo_links(self):
+        node_c = self.create_node("C")
+        preds = [self.create_node(f"P{i}") for i in range(3)]
+        for pred in preds:
+            node_c.blocked_predecessors.add(pred)
+        node_c.blocked_predecessors.add(preds[0])  # already registered: no-op
+
+        self.assertEqual(list(node_c.blocked_predecessors), preds)
+        node_c.blocked_predecessors.discard(preds[1])
+        self.assertEqual(list(node_c.blocked_predecessors), [preds[0], preds[2]])
+        self.assertNotIn(preds[1], node_c.blocked_predecessors)
+
+        # A node can only be blocked on one successor at a time
+        node_d = self.create_node("D")
+        node_d.blocked_predecessors.add(preds[0])
+        self.assertEqual(list(node_c.blocked_predecessors), [preds[2]])
+        self.assertIn(preds[0], node_d.blocked_predecessors)
+
 
 if __name__ == '__main__':
     unittest.main()
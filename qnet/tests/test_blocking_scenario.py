@@ -1,3 +1,4 @@
+import logging
 import unittest
 from dataclasses import dataclass, field
 from typing import List, Any
@@ -9,6 +10,9 @@ from qnet.simulation_node import NodeMetrics, NodeState
 from qnet.simulation_engine import Model, Nodes, ModelMetrics
 from qnet.results_logger import BaseLogger
 
+# Per-test confirmations; silent unless LOGLEVEL is set (see logging_setup.py)
+log = logging.getLogger(__name__)
+
 # --- Helper Classes ---
 
 @dataclass
@@ -84,7 +88,7 @@ class TestComprehensiveBlocking(unittest.TestCase):
         self.assertEqual(node.channel_pool.num_occupied_channels, 1, "Server should be busy with new item")
         self.assertEqual(node.state, NodeState.BUSY)
         
-        print("\n✓ Scenario 1 (Refill): Queue correctly refills server upon unblocking.")
+        log.debug("✓ Scenario 1 (Refill): Queue correctly refills server upon unblocking.")
 
     # =========================================================================
     # SCENARIO 2: Multi-Channel Saturation
@@ -118,7 +122,7 @@ class TestComprehensiveBlocking(unittest.TestCase):
         node.start_action(TestItem("Item3"))
         self.assertEqual(node.metrics.num_failures, 1)
 
-        print("\n✓ Scenario 2 (Multi-Channel): Partial and Full blocking handled correctly.")
+        log.debug("✓ Scenario 2 (Multi-Channel): Partial and Full blocking handled correctly.")
 
     # =========================================================================
     # SCENARIO 3: The "Zipper" Merge (Race Condition)
@@ -150,7 +154,7 @@ class TestComprehensiveBlocking(unittest.TestCase):
         self.assertEqual(total_blocked, 1, "Exactly one node should remain blocked")
         self.assertEqual(c.channel_pool.num_occupied_channels, 1, "C should be busy")
 
-        print("\n✓ Scenario 3 (Zipper): Race condition resolved atomically.")
+        log.debug("✓ Scenario 3 (Zipper): Race condition resolved atomically.")
 
     # =========================================================================
     # SCENARIO 4: Zero-Buffer Pipeline (Strict Blocking)
@@ -204,7 +208,7 @@ class TestComprehensiveBlocking(unittest.TestCase):
         # D should have Item_C
         self.assertEqual(next(iter(nodes[3].current_items)).name, "Item_C")
 
-        print("\n✓ Scenario 4 (Zero-Buffer): Instant chain unblocking verified.")
+        log.debug("✓ Scenario 4 (Zero-Buffer): Instant chain unblocking verified.")
 
     # =========================================================================
     # SCENARIO 5: Deadlock Stability (Circular)
@@ -238,7 +242,7 @@ class TestComprehensiveBlocking(unittest.TestCase):
         self.assertEqual(len(a.blocked_tasks), 0)
         self.assertEqual(b.num_tasks, 1) # B has ItemA
         
-        print("\n✓ Scenario 5 (Deadlock): Circular notification handled safely.")
+        log.debug("✓ Scenario 5 (Deadlock): Circular notification handled safely.")
 
     # =========================================================================
     # SCENARIO 6: Ordering (FIFO)
@@ -270,7 +274,9 @@ class TestComprehensiveBlocking(unittest.TestCase):
         self.assertEqual(wall_item.name, "Item1")
         self.assertEqual(a.blocked_tasks[0].item.name, "Item2")
 
-        print("\n✓ Scenario 6 (FIFO): Blocked items unblocked in arrival order.")
+        log.debug("✓ Scenario 6 (FIFO): Blocked items unblocked in arrival order.")
 
 if __name__ == '__main__':
+    from logging_setup import configure_logging
+    configure_logging()
     unittest.main()
\ No newline at end of file
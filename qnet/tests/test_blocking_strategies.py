@@ -1,3 +1,4 @@
+import logging
 import unittest
 from dataclasses import dataclass, field
 from typing import List, Any, Optional, Protocol, runtime_checkable
@@ -10,18 +11,34 @@ from qnet.simulation_node import NodeMetrics
 from qnet.simulation_engine import Model, Nodes, ModelMetrics
 from qnet.results_logger import BaseLogger
 
+# Per-test confirmations; silent unless LOGLEVEL is set (see logging_setup.py)
+log = logging.getLogger(__name__)
+
 # --- MOCKS & HELPERS ---
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class TestItem:
     name: str
     id: int = 0
-    time_in_system: float = field(default=0.0, compare=False, hash=False)
-    processed: bool = field(default=False, compare=False, hash=False)
-    current_time: float = field(default=0.0, compare=False, hash=False)
-    history: List[Any] = field(default_factory=list, compare=False, hash=False) 
+    time_in_system: float = 0.0
+    processed: bool = False
+    current_time: float = 0.0
+    history: List[Any] = field(default_factory=list)
     def __repr__(self): return self.name
 
+    # Identity is (name, id); the items here share the default id, so the name is needed too
+    def __post_init__(self):
+        # name and id are never reassigned, so the hash is computed once
+        self._hash = hash((self.name, self.id))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, TestItem):
+            return NotImplemented
+        return self.name == other.name and self.id == other.id
+
 class SilentLogger(BaseLogger):
     def log(self, *args, **kwargs): pass
     def nodes_states(self, time, nodes): pass
@@ -122,7 +139,7 @@ class TestBlockingStrategies(unittest.TestCase):
         self.assertEqual(len(node.blocked_tasks), 1)
         self.assertEqual(node.metrics.num_blocks, 1)
         self.assertFalse(item.processed, "Item should not be processed/gone")
-        print("\n✓ Strategy: BLOCK strategy correctly holds item and sets state.")
+        log.debug("✓ Strategy: BLOCK strategy correctly holds item and sets state.")
 
     # 2. TEST DROP STRATEGY (Loss System)
     def test_drop_strategy(self):
@@ -140,7 +157,7 @@ class TestBlockingStrategies(unittest.TestCase):
         self.assertEqual(len(node.blocked_tasks), 0)
         self.assertEqual(node.metrics.num_drops, 1)
         self.assertEqual(node.metrics.num_out, 1, "Item should be counted as 'out'")
-        print("\n✓ Strategy: DROP strategy correctly discards item and frees channel.")
+        log.debug("✓ Strategy: DROP strategy correctly discards item and frees channel.")
 
     # 3. TEST REPROCESS STRATEGY (Re-queue)
     def test_reprocess_strategy(self):
@@ -167,7 +184,7 @@ class TestBlockingStrategies(unittest.TestCase):
                         "Item should be re-queued (or immediately re-processed)")
         
         self.assertEqual(node.metrics.num_blocks, 1)
-        print("\n✓ Strategy: REPROCESS strategy moves item back to queue.")
+        log.debug("✓ Strategy: REPROCESS strategy moves item back to queue.")
 
     # 4. TEST REROUTE STRATEGY (Custom Logic)
     def test_reroute_strategy(self):
@@ -191,7 +208,7 @@ class TestBlockingStrategies(unittest.TestCase):
         # Verify item is now in Backup node
         self.assertEqual(backup.metrics.num_in, 1)
         self.assertEqual(next(iter(backup.current_items)), item)
-        print("\n✓ Strategy: CUSTOM REROUTE strategy successfully moved item to backup node.")
+        log.debug("✓ Strategy: CUSTOM REROUTE strategy successfully moved item to backup node.")
 
     # 5. TEST REFILL LOGIC (The "One Go" Fix)
     def test_refill_on_drop(self):
@@ -219,7 +236,9 @@ class TestBlockingStrategies(unittest.TestCase):
         self.assertEqual(node.channel_pool.num_occupied_channels, 1, "Channel should be busy again")
         self.assertEqual(node.state, NodeState.BUSY)
         
-        print("\n✓ Logic: Node correctly refills from queue immediately after dropping blocked item.")
+        log.debug("✓ Logic: Node correctly refills from queue immediately after dropping blocked item.")
 
 if __name__ == '__main__':
+    from logging_setup import configure_logging
+    configure_logging()
     unittest.main()
\ No newline at end of file
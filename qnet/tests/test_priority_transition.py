@@ -1,8 +1,12 @@
+import logging
 import unittest
 from collections import Counter
 from qnet.routing_node import PriorityGroupTransitionNode
 from qnet.simulation_node import NodeMetrics
 
+# Per-test confirmations; silent unless LOGLEVEL is set (see logging_setup.py)
+log = logging.getLogger(__name__)
+
 # --- MOCKS ---
 class MockNode:
     def __init__(self, name: str, is_full: bool = False):
@@ -43,7 +47,7 @@ class TestDeepPriorityRouting(unittest.TestCase):
 
     def test_load_balancing_distribution(self):
         """
-        STATISTICAL: If Prio 1 has 3 free nodes, are they picked roughly equally?
+        BALANCE: If Prio 1 has 3 free nodes, are they picked equally?
         This catches bugs where we might always pick the first index [0].
         """
         nodes = [MockNode(f"N{i}") for i in range(3)]
@@ -59,9 +63,22 @@ class TestDeepPriorityRouting(unittest.TestCase):
         # Check distribution
         for n in nodes:
             count = counts[n.name]
-            self.assertGreater(count, 50, f"Node {n.name} was picked too rarely ({count}/300). Distribution is broken.")
+            self.assertEqual(count, 100, f"Node {n.name} was picked {count}/300 times. Free nodes are picked in round-robin order.")
         
-        print(f"\n[OK] Distribution: {dict(counts)}")
+        log.debug("[OK] Distribution: %s", counts)
+
+    def test_round_robin_skips_full_nodes(self):
+        """
+        BALANCE: A node that fills up is skipped without disturbing the turn order of the others.
+        """
+        nodes = [MockNode(f"N{i}") for i in range(3)]
+        for n in nodes:
+            self.router.add_next_node(n, priority=1)
+
+        self.assertEqual(self.router._get_next_node(None), nodes[0])
+        nodes[0]._is_full = True
+        picks = [self.router._get_next_node(None) for _ in range(4)]
+        self.assertEqual(picks, [nodes[1], nodes[2], nodes[1], nodes[2]])
 
     def test_strict_blocking_hierarchy(self):
         """
@@ -111,7 +128,19 @@ class TestDeepPriorityRouting(unittest.TestCase):
         primary._is_full = False
         self.assertEqual(self.router._get_next_node(None), primary)
         
-        print("\n[OK] Dynamic: Correctly adapts to changing node states.")
+        log.debug("[OK] Dynamic: Correctly adapts to changing node states.")
+
+    def test_priority_added_after_routing(self):
+        """
+        DYNAMIC: A higher priority group added after the router has already routed takes precedence.
+        """
+        backup = MockNode("Backup")
+        self.router.add_next_node(backup, priority=2)
+        self.assertEqual(self.router._get_next_node(None), backup)
+
+        primary = MockNode("Primary")
+        self.router.add_next_node(primary, priority=1)
+        self.assertEqual(self.router._get_next_node(None), primary)
 
     def test_empty_router(self):
         """
@@ -121,4 +150,6 @@ class TestDeepPriorityRouting(unittest.TestCase):
         self.assertIsNone(selected, "Empty router should return None.")
 
 if __name__ == '__main__':
+    from logging_setup import configure_logging
+    configure_logging()
     unittest.main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 import unittest
 from dataclasses import dataclass, field
 from typing import List, Any
@@ -6,11 +7,15 @@ import heapq
 # Correct Imports
 from qnet.core_models import Queue
 # Import Task from service_node to ensure class compatibility
-from qnet.service_node import QueueingNode, ChannelPool, QueueingMetrics, blocking_on_queue_length, Channel, Task
+from qnet.service_node import QueueingNode, ChannelPool, QueueingMetrics, blocking_on_queue_length, Task
 from qnet.simulation_node import NodeMetrics, NodeState
-from qnet.simulation_engine import Model, Nodes, ModelMetrics
+from qnet.simulation_engine import Model, Nodes, ModelMetrics, Verbosity
+from qnet.item_generator import FactoryNode
 from qnet.results_logger import BaseLogger
 
+# Per-test confirmations; silent unless LOGLEVEL is set (see logging_setup.py)
+log = logging.getLogger(__name__)
+
 # --- Helper Classes ---
 
 @dataclass
@@ -23,12 +28,16 @@ class TestItem:
     current_time: float = field(default=0.0, compare=False)
     history: List[Any] = field(default_factory=list, compare=False) 
     
+    def __post_init__(self):
+        # name and id are never reassigned, so the hash is computed once
+        self._hash = hash((self.name, self.id))
+
     def __repr__(self): 
         return self.name
         
     # Explicit hash to prevent "unhashable type" error in Model sets
     def __hash__(self):
-        return hash((self.name, self.id))
+        return self._hash
         
     def __eq__(self, other):
         if not isinstance(other, TestItem):
@@ -44,9 +53,11 @@ class SilentLogger(BaseLogger):
 
 class TestSimulationMechanics(unittest.TestCase):
 
-    def setUp(self):
-        self.logger = SilentLogger()
-        
+    @classmethod
+    def setUpClass(cls):
+        # The logger is stateless, so one instance serves every test
+        cls.logger = SilentLogger()
+
     def create_node(self, name, channels=1, delay=1.0):
         return QueueingNode(
             name=name,
@@ -76,7 +87,32 @@ class TestSimulationMechanics(unittest.TestCase):
         self.assertEqual(node.channel_pool.next_finish_time, 2.0)
         finished_task = node.channel_pool.pop_finished_task()
         self.assertEqual(finished_task.item.name, "Fast")
-        print("\n✓ Mechanics: ChannelPool correctly prioritizes earliest finishing tasks.")
+        log.debug("✓ Mechanics: ChannelPool correctly prioritizes earliest finishing tasks.")
+
+    def test_channel_ids_are_reused(self):
+        pool = ChannelPool(3)
+        pool.add_task(Task(TestItem("T1", id=1), next_time=1.0))
+        pool.add_task(Task(TestItem("T2", id=2), next_time=2.0))
+        self.assertEqual(list(pool.occupied_channels), [0, 1])
+
+        pool.pop_finished_task()  # frees channel 0
+        self.assertEqual(pool.num_occupied_channels, 1)
+
+        pool.add_task(Task(TestItem("T3", id=3), next_time=3.0))
+        self.assertEqual(list(pool.occupied_channels), [0, 1], "Freed channel id must be reused")
+        self.assertEqual(pool.num_channels, 2)
+        self.assertEqual(len(pool.occupied_channels), 2)
+        self.assertIn(1, pool.occupied_channels)
+
+    def test_full_channel_pool_rejects_task(self):
+        pool = ChannelPool(1)
+        pool.add_task(Task(TestItem("A", id=1), next_time=1.0))
+        with self.assertRaises(RuntimeError):
+            pool.add_task(Task(TestItem("B", id=2), next_time=2.0))
+
+        # The task in service is kept, and no channel beyond the limit was allocated
+        self.assertEqual([task.item.name for task in pool.tasks.data], ["A"])
+        self.assertEqual(pool.num_occupied_channels, 1)
 
     # =========================================================================
     # TEST 2: Custom Blocking Predicates
@@ -95,7 +131,7 @@ class TestSimulationMechanics(unittest.TestCase):
         node_a.end_action()
         
         self.assertEqual(node_a.state, NodeState.BLOCKED)
-        print("\n✓ Mechanics: Custom blocking predicates override standard logic.")
+        log.debug("✓ Mechanics: Custom blocking predicates override standard logic.")
 
     # =========================================================================
     # TEST 3: Metrics Integration
@@ -105,8 +141,7 @@ class TestSimulationMechanics(unittest.TestCase):
         node.update_time(2.0)
         
         # Add to queue manually
-        fake_channel = Channel(id=99)
-        node.channel_pool.occupied_channels.add(fake_channel) 
+        node.channel_pool._occupy_channel()
         node.queue.push(TestItem("Q_Item", id=1))
         
         node.update_time(6.0) # Queue=1 for 4.0s
@@ -115,7 +150,34 @@ class TestSimulationMechanics(unittest.TestCase):
         
         expected_mean = 4.0 / 10.0
         self.assertAlmostEqual(node.metrics.mean_queuelen, expected_mean, delta=0.001)
-        print(f"\n✓ Mechanics: Metrics integration (L = {node.metrics.mean_queuelen}) is correct.")
+        log.debug("✓ Mechanics: Metrics integration (L = %s) is correct.", node.metrics.mean_queuelen)
+
+    def test_sampled_arrival_intervals(self):
+        node = QueueingNode(
+            name="Sampled",
+            queue=Queue(10),
+            channel_pool=ChannelPool(1),
+            metrics=QueueingMetrics(sample_stride=2),
+            delay_fn=lambda: 100.0
+        )
+        # Arrivals at t=0, 1, 3, 6: only the 1st->2nd and 3rd->4th gaps are sampled
+        for i, time in enumerate((0.0, 1.0, 3.0, 6.0)):
+            node.update_time(time)
+            node.start_action(TestItem(f"S{i}", id=i))
+            if i == 1:
+                node.metrics.num_in -= 1  # e.g. an item moved to a neighbouring node: the phase must not shift
+
+        self.assertEqual(node.metrics.num_in, 3)
+        self.assertEqual(node.metrics.num_in_samples, 2)
+        self.assertAlmostEqual(node.metrics.mean_in_interval, (1.0 + 3.0) / 2)
+
+        node.reset_metrics()
+        self.assertEqual(node.metrics.sample_stride, 2, "Configuration must survive a metrics reset")
+        self.assertEqual(node.metrics.in_countdown, 1)
+
+    def test_invalid_sample_stride(self):
+        with self.assertRaises(ValueError):
+            QueueingMetrics(sample_stride=0)
 
     # =========================================================================
     # TEST 4: Engine Event Interleaving
@@ -128,10 +190,8 @@ class TestSimulationMechanics(unittest.TestCase):
         node_b.start_action(TestItem("B", id=2)) 
         
         # Verify state BEFORE Model init
-        # (Assuming ChannelPool.tasks is accessible via .heap for inspection)
-        if hasattr(node_a.channel_pool.tasks, 'heap'):
-            self.assertEqual(len(node_a.channel_pool.tasks.heap), 1, "Heap check A")
-            self.assertEqual(len(node_b.channel_pool.tasks.heap), 1, "Heap check B")
+        self.assertEqual(node_a.channel_pool.num_active_tasks, 1, "Heap check A")
+        self.assertEqual(node_b.channel_pool.num_active_tasks, 1, "Heap check B")
 
         nodes = Nodes()
         nodes["A"] = node_a
@@ -144,9 +204,8 @@ class TestSimulationMechanics(unittest.TestCase):
         # ----------------------------------------------------
 
         # Verify state AFTER Model init
-        if hasattr(node_a.channel_pool.tasks, 'heap'):
-             self.assertEqual(len(node_a.channel_pool.tasks.heap), 1, 
-                              "CRITICAL: Model init destroyed the heap! Fix QueueingNode.current_items.")
+        self.assertEqual(node_a.channel_pool.num_active_tasks, 1,
+                         "CRITICAL: Model init destroyed the heap! Fix QueueingNode.current_items.")
 
         # Step 1 -> t=3.0
         model.step()
@@ -159,7 +218,77 @@ class TestSimulationMechanics(unittest.TestCase):
         self.assertEqual(model.current_time, 5.0)
         self.assertEqual(node_a.metrics.num_out, 1)
         
-        print("\n✓ Mechanics: Discrete Event Engine strictly respects time ordering.")
+        log.debug("✓ Mechanics: Discrete Event Engine strictly respects time ordering.")
+
+    def test_rescheduled_node_skips_outdated_event(self):
+        node_a = self.create_node("A", delay=5.0)
+        node_b = self.create_node("B", delay=3.0)
+        node_a.start_action(TestItem("A", id=1))
+        node_b.start_action(TestItem("B", id=2))
+
+        nodes = Nodes()
+        nodes["A"] = node_a
+        nodes["B"] = node_b
+        model = Model(nodes, self.logger, ModelMetrics())
+        self.assertEqual(model.next_time, 3.0)
+
+        # The event scheduled at t=3.0 is now outdated
+        node_b.next_time = 6.0
+        self.assertEqual(model.next_time, 5.0)
+
+    def test_reassigned_delay_fn(self):
+        node = self.create_node("Delay", delay=1.0)
+        node.delay_fn = lambda item: 4.0 if item.id == 2 else 2.0
+        node.start_action(TestItem("D", id=2))
+        self.assertEqual(node.next_time, 4.0)
+
+    def test_auto_names_are_unique(self):
+        node_a = QueueingNode(queue=Queue(1), channel_pool=ChannelPool(1), metrics=QueueingMetrics(), delay_fn=lambda: 1.0)
+        node_b = QueueingNode(queue=Queue(1), channel_pool=ChannelPool(1), metrics=QueueingMetrics(), delay_fn=lambda: 1.0)
+        self.assertNotEqual(node_a.name, node_b.name)
+        self.assertEqual(node_b.metrics.node_name, node_b.name)
+
+        node_a.set_next_node(node_b)
+        self.assertEqual(list(Nodes.from_node_tree_root(node_a)), [node_a.name, node_b.name])
+
+    def test_deep_network_collection(self):
+        # Deeper than the default recursion limit
+        nodes = [self.create_node(f"N{i}") for i in range(2000)]
+        for node, next_node in zip(nodes, nodes[1:]):
+            node.set_next_node(next_node)
+
+        collected = Nodes.from_node_tree_root(nodes[0])
+        self.assertEqual(list(collected), [node.name for node in nodes])
+
+    # =========================================================================
+    # TEST 5: State Checkpoints
+    # =========================================================================
+    def test_save_and_load_state(self):
+        factory = FactoryNode(delay_fn=lambda: 0.3, metrics=NodeMetrics(), name="Source")
+        node_a = self.create_node("A", channels=2, delay=1.0)
+        node_b = QueueingNode(
+            name="B",
+            queue=Queue(0),
+            channel_pool=ChannelPool(1),
+            metrics=QueueingMetrics(),
+            delay_fn=lambda: 0.7
+        )
+        factory.set_next_node(node_a)
+        node_a.set_next_node(node_b)
+        model = Model(Nodes.from_node_tree_root(factory), self.logger, ModelMetrics())
+
+        model.simulate(end_time=5.0, verbosity=Verbosity.NONE)
+        state = model.save_state()
+        model.simulate(end_time=12.0, verbosity=Verbosity.NONE)
+        expected = [(nd.name, nd.metrics.num_in, nd.metrics.num_out, nd.next_time) for nd in model.nodes.values()]
+
+        model.load_state(state)
+        self.assertEqual(model.current_time, 5.0)
+        model.simulate(end_time=12.0, verbosity=Verbosity.NONE)
+        actual = [(nd.name, nd.metrics.num_in, nd.metrics.num_out, nd.next_time) for nd in model.nodes.values()]
+        self.assertEqual(actual, expected)
 
 if __name__ == '__main__':
+    from logging_setup import configure_logging
+    configure_logging()
     unittest.main()
\ No newline at end of file